@@ -8,7 +8,10 @@ from .simple_agent import (
     TradingAgent,
     create_news_agent,
     create_technical_agent,
-    create_fundamental_agent
+    create_fundamental_agent,
+    analyze_batch,
+    run_agents_parallel,
+    run_debate_parallel
 )
 
 from ..llm import LLMClient
@@ -85,5 +88,8 @@ __all__ = [
     "build_agents",
     "create_news_agent",
     "create_technical_agent",
-    "create_fundamental_agent"
+    "create_fundamental_agent",
+    "analyze_batch",
+    "run_agents_parallel",
+    "run_debate_parallel"
 ]
@@ -8,13 +8,294 @@ The LLM Controller handles all orchestration.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
-from typing import Any, Callable, Dict, List, Optional
+import os
+import sys
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
+from ..cache import CacheStore, make_cache_key
+from ..jsonutils import find_balanced_json as _find_balanced_json
+from ..jsonutils import json_dumps as _json_dumps
+from ..jsonutils import json_loads as _json_loads
 from ..llm import LLMClient
 from ..models import AnalysisRequest, AgentProposal
 
 
+# Keys of the fixed proposal schema, in the order the prompt asks for them.
+# _fast_parse_proposal scans for these directly instead of running a generic
+# JSON parser over the whole response; any mismatch falls back to the
+# generic extractor.
+_PROPOSAL_KEYS = ('"action"', '"conviction"', '"thesis"', '"evidence"')
+
+
+def _scan_string(text: str, start: int) -> Optional[Tuple[str, int]]:
+    """Read a JSON string starting at text[start] == '\"'. Returns (value, end)."""
+    if start >= len(text) or text[start] != '"':
+        return None
+    i = start + 1
+    has_escape = False
+    while i < len(text):
+        ch = text[i]
+        if ch == '\\':
+            has_escape = True
+            i += 2
+            continue
+        if ch == '"':
+            raw = text[start:i + 1]
+            if not has_escape:
+                return raw[1:-1], i + 1
+            try:
+                return _json_loads(raw), i + 1
+            except ValueError:
+                return None
+        i += 1
+    return None
+
+
+def _scan_value_start(text: str, key: str, search_from: int) -> int:
+    """Find key after search_from and return the index where its value starts, or -1."""
+    key_pos = text.find(key, search_from)
+    if key_pos == -1:
+        return -1
+    i = key_pos + len(key)
+    while i < len(text) and text[i] in ' \t\r\n':
+        i += 1
+    if i >= len(text) or text[i] != ':':
+        return -1
+    i += 1
+    while i < len(text) and text[i] in ' \t\r\n':
+        i += 1
+    return i if i < len(text) else -1
+
+
+def _fast_parse_proposal(response: str) -> Optional[Dict[str, Any]]:
+    """
+    Schema-specialized parse of the proposal JSON.
+
+    Walks the known keys in their expected order with str.find and reads each
+    value directly. Returns None on any structural surprise so callers can
+    fall back to the generic extractor.
+    """
+    pos = response.find('{')
+    if pos == -1:
+        return None
+
+    # action: string
+    i = _scan_value_start(response, _PROPOSAL_KEYS[0], pos)
+    if i == -1:
+        return None
+    scanned = _scan_string(response, i)
+    if scanned is None:
+        return None
+    action, i = scanned
+
+    # conviction: number
+    i = _scan_value_start(response, _PROPOSAL_KEYS[1], i)
+    if i == -1:
+        return None
+    end = i
+    while end < len(response) and response[end] in '+-0123456789.eE':
+        end += 1
+    try:
+        conviction = float(response[i:end])
+    except ValueError:
+        return None
+    i = end
+
+    # thesis: string
+    i = _scan_value_start(response, _PROPOSAL_KEYS[2], i)
+    if i == -1:
+        return None
+    scanned = _scan_string(response, i)
+    if scanned is None:
+        return None
+    thesis, i = scanned
+
+    # evidence: list of strings - delegate the span to the JSON parser
+    i = _scan_value_start(response, _PROPOSAL_KEYS[3], i)
+    if i == -1 or response[i] != '[':
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    end = -1
+    for j in range(i, len(response)):
+        ch = response[j]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '[':
+            depth += 1
+        elif ch == ']':
+            depth -= 1
+            if depth == 0:
+                end = j
+                break
+    if end == -1:
+        return None
+    try:
+        evidence = _json_loads(response[i:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(evidence, list):
+        return None
+
+    return {
+        "action": action,
+        "conviction": conviction,
+        "thesis": thesis,
+        "evidence": evidence,
+    }
+
+
+# Persistent cross-run proposal cache (see cache.py). Opt-in via
+# PROPOSAL_CACHE_PATH; backtest sweeps replaying the same inputs then skip
+# the LLM call entirely.
+_PROPOSAL_CACHE_PATH = os.environ.get("PROPOSAL_CACHE_PATH")
+_proposal_cache: Optional[CacheStore] = None
+
+
+def _get_proposal_cache() -> Optional[CacheStore]:
+    """Lazily open the persistent proposal cache, or None when disabled."""
+    global _proposal_cache
+    if _proposal_cache is None and _PROPOSAL_CACHE_PATH:
+        _proposal_cache = CacheStore(_PROPOSAL_CACHE_PATH)
+    return _proposal_cache
+
+
+# Data tools are pure functions of (symbol, trade_date), so results are
+# memoized with a short TTL. Per-key locks deduplicate in-flight calls when
+# several agents request the same tool payload concurrently.
+_FETCH_CACHE_TTL = 60.0  # seconds
+_FETCH_CACHE_MAX = 512
+_FETCH_CACHE: Dict[Tuple[str, str, Optional[str]], Tuple[float, str]] = {}
+# Lock maps are keyed per running event loop: an asyncio.Lock is bound to
+# the loop it was created on, so a module-level map would hand locks from a
+# finished asyncio.run to the next one and raise "bound to a different
+# event loop". WeakKeyDictionary lets a closed loop's locks be collected.
+_FETCH_LOCKS: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str, Optional[str]], asyncio.Lock]]" = (
+    WeakKeyDictionary()
+)
+
+
+async def _call_tool_cached(tool: Callable, symbol: str, trade_date: Optional[str]) -> str:
+    """Call a data tool, serving repeat requests from the TTL cache."""
+    key = (tool.__name__, symbol, trade_date)
+
+    cached = _FETCH_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _FETCH_CACHE_TTL:
+        return cached[1]
+
+    locks = _FETCH_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    lock = locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another task may have populated the cache while we waited
+        cached = _FETCH_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _FETCH_CACHE_TTL:
+            return cached[1]
+
+        # Native coroutine tools are awaited directly; only blocking sync
+        # tools pay for a worker thread.
+        if asyncio.iscoroutinefunction(tool):
+            result = await tool(symbol, trade_date)
+        else:
+            result = await asyncio.to_thread(tool, symbol, trade_date)
+        if len(_FETCH_CACHE) >= _FETCH_CACHE_MAX:
+            # Prune expired entries (and their locks) before growing further
+            now = time.monotonic()
+            for stale in [k for k, (ts, _) in _FETCH_CACHE.items()
+                          if now - ts >= _FETCH_CACHE_TTL]:
+                del _FETCH_CACHE[stale]
+                locks.pop(stale, None)
+        _FETCH_CACHE[key] = (time.monotonic(), result)
+        return result
+
+
+# Analysis prompt skeleton, precompiled once at import so each analyze() call
+# only substitutes the varying fields instead of re-rendering the f-string.
+_ANALYSIS_TEMPLATE = """Analyze {symbol} for a {horizon} investment decision.
+
+MARKET CONTEXT: {market_context}
+
+{task_line}
+
+AVAILABLE DATA:
+{data_context}
+
+OUTPUT FORMAT (JSON):
+{{
+    "action": "BUY/SELL/HOLD",
+    "conviction": 0.0-1.0 (your confidence level),
+    "thesis": "Your main argument in 1-2 sentences",
+    "evidence": [
+        "Specific evidence point 1 with exact data",
+        "Specific evidence point 2 with exact data",
+        "..."
+    ]
+}}
+
+Provide your analysis based on your expertise area ({name})."""
+
+
+# Constant fragments of the debate prompt. The prompt layout is fixed, so we
+# join prebuilt chunks with the per-call fields instead of re-rendering one
+# large f-string on every debate turn.
+_DEBATE_HEAD = "You are participating in a structured debate about "
+_DEBATE_POS_ACTION = """.
+
+YOUR INITIAL POSITION:
+- Action: """
+_DEBATE_POS_CONVICTION = "\n- Conviction: "
+_DEBATE_POS_THESIS = "\n- Thesis: "
+_DEBATE_POS_EVIDENCE = "\n- Evidence: "
+_DEBATE_PEERS = """
+
+OTHER ANALYSTS' POSITIONS:
+"""
+_DEBATE_FOCUS = "\n\nDEBATE FOCUS: "
+_DEBATE_INSTRUCTION = "\n\nMODERATOR INSTRUCTION: "
+_DEBATE_TASK = """
+
+TASK:
+Consider the counterarguments and evidence from other analysts.
+You may:
+1. Defend your position with additional evidence
+2. Adjust your conviction based on new insights
+3. Change your recommendation if convinced by strong arguments
+
+Respond with updated analysis in JSON format:
+{
+    "action": "BUY/SELL/HOLD",
+    "conviction": 0.0-1.0,
+    "thesis": "Your updated thesis",
+    "evidence": ["Evidence point 1", "Evidence point 2", ...],
+    "changes_made": "What changed from your initial position and why"
+}
+
+Base your response on your area of expertise: """
+_DEBATE_TAIL = " analysis."
+
+
+# All opposing action pairs: BUY vs SELL directly conflict, and HOLD mildly
+# opposes either active position. Actions are normalized to upper case at
+# proposal construction, so membership is a single frozenset lookup.
+_OPPOSING = frozenset({
+    ("BUY", "SELL"), ("SELL", "BUY"),
+    ("BUY", "HOLD"), ("HOLD", "BUY"),
+    ("SELL", "HOLD"), ("HOLD", "SELL"),
+})
+
+
 class TradingAgent:
     """
     Base class for trading analysis agents.
@@ -44,10 +325,20 @@ class TradingAgent:
             system_prompt: System prompt defining agent's role and expertise
             data_tools: Optional list of data fetching functions
         """
-        self.name = name
+        self.name = sys.intern(name)
         self.llm = llm_client
         self.system_prompt = system_prompt
         self.data_tools = data_tools or []
+        # Prebuilt system message, reused across calls so each LLM call only
+        # allocates the user message. Treated as read-only.
+        self._system_msg = {"role": "system", "content": system_prompt}
+        # Tokenize the static system prompt once at construction when the
+        # backend exposes a tokenizer: the IDs themselves are discarded (no
+        # complete() path accepts them), but the call warms the tokenizer's
+        # internal caches so the first analyze() doesn't pay for it.
+        tokenize = getattr(llm_client, "tokenize", None)
+        if callable(tokenize):
+            tokenize(system_prompt)
     
     async def analyze(
         self,
@@ -76,24 +367,54 @@ class TradingAgent:
             data_context = preloaded_data
         else:
             data_context = await self._fetch_data(request)
-        
+
+        # Persistent cache: reruns of an identical analysis (same inputs,
+        # prompts and data) return the stored proposal without an LLM call
+        cache = _get_proposal_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = make_cache_key(
+                agent=self.name,
+                symbol=request.symbol,
+                trade_date=request.trade_date,
+                horizon=request.horizon,
+                market_context=request.market_context,
+                task=specific_task,
+                system=dynamic_system_prompt or self.system_prompt,
+                data=hashlib.blake2b(data_context.encode(), digest_size=16).hexdigest(),
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return AgentProposal(**_json_loads(cached))
+
         # Create analysis prompt
         prompt = self._create_analysis_prompt(request, data_context, specific_task)
         
-        # Use dynamic system prompt if provided, otherwise use default
-        system_prompt = dynamic_system_prompt if dynamic_system_prompt else self.system_prompt
-        
-        # Get LLM analysis
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt}
-        ]
-        
-        response = await self.llm.complete(messages, max_tokens=800)
-        
+        # Use dynamic system prompt if provided, otherwise reuse the prebuilt
+        # default system message (no new dict on the common path)
+        system_msg = (
+            {"role": "system", "content": dynamic_system_prompt}
+            if dynamic_system_prompt else self._system_msg
+        )
+
+        # Get LLM analysis, stopping as soon as the proposal JSON is complete
+        messages = [system_msg, {"role": "user", "content": prompt}]
+
+        # Default system prompts are stable across calls, so let the provider
+        # cache the tokenized prefix
+        response = await self._complete_early_stop(
+            messages, max_tokens=800,
+            cacheable_system=dynamic_system_prompt is None
+        )
+
         # Parse response into proposal
         proposal = self._parse_proposal(response)
-        
+
+        # Persist successful parses only - neutral fallbacks would pin a
+        # transient failure into every future run
+        if cache_key is not None and not proposal.neutral:
+            cache.put(cache_key, _json_dumps(proposal.to_dict()).encode())
+
         return proposal
     
     async def debate(
@@ -120,52 +441,71 @@ class TradingAgent:
         # Format peer arguments
         peer_summary = self._format_peer_proposals(peer_proposals, initial_proposal)
         
-        # Create debate prompt
-        prompt = f"""You are participating in a structured debate about {request.symbol}.
+        # Create debate prompt from prebuilt fragments (see module constants)
+        prompt = ''.join((
+            _DEBATE_HEAD, request.symbol,
+            _DEBATE_POS_ACTION, initial_proposal.action,
+            _DEBATE_POS_CONVICTION, f"{initial_proposal.conviction:.2f}",
+            _DEBATE_POS_THESIS, initial_proposal.thesis,
+            _DEBATE_POS_EVIDENCE, ', '.join(initial_proposal.top_evidence),
+            _DEBATE_PEERS, peer_summary,
+            _DEBATE_FOCUS, debate_focus,
+            _DEBATE_INSTRUCTION, specific_instruction,
+            _DEBATE_TASK, self.name,
+            _DEBATE_TAIL,
+        ))
 
-YOUR INITIAL POSITION:
-- Action: {initial_proposal.action}
-- Conviction: {initial_proposal.conviction:.2f}
-- Thesis: {initial_proposal.thesis}
-- Evidence: {', '.join(initial_proposal.evidence[:3])}
+        messages = [self._system_msg, {"role": "user", "content": prompt}]
 
-OTHER ANALYSTS' POSITIONS:
-{peer_summary}
+        # Escalate to the strong model tier only when a high-conviction peer
+        # opposes this position - those are the revisions that can actually
+        # swing the decision. Routine rounds stay on the fast tier.
+        tier = "strong" if any(
+            prop.conviction > 0.7
+            and self._is_opposing(initial_proposal.action, prop.action)
+            for prop in peer_proposals.values()
+        ) else "fast"
 
-DEBATE FOCUS: {debate_focus}
+        response = await self.llm.complete(
+            messages, max_tokens=800, cacheable_system=True, tier=tier
+        )
 
-MODERATOR INSTRUCTION: {specific_instruction}
-
-TASK:
-Consider the counterarguments and evidence from other analysts.
-You may:
-1. Defend your position with additional evidence
-2. Adjust your conviction based on new insights
-3. Change your recommendation if convinced by strong arguments
-
-Respond with updated analysis in JSON format:
-{{
-    "action": "BUY/SELL/HOLD",
-    "conviction": 0.0-1.0,
-    "thesis": "Your updated thesis",
-    "evidence": ["Evidence point 1", "Evidence point 2", ...],
-    "changes_made": "What changed from your initial position and why"
-}}
-
-Base your response on your area of expertise: {self.name} analysis."""
-
-        messages = [
-            {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": prompt}
-        ]
-        
-        response = await self.llm.complete(messages, max_tokens=800)
-        
         # Parse revised proposal
         revised_proposal = self._parse_proposal(response)
         
         return revised_proposal
     
+    async def _complete_early_stop(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        **kwargs: Any
+    ) -> str:
+        """
+        Get a completion, returning as soon as the response contains a
+        complete JSON object.
+
+        Streams chunks when the client supports it and stops once the first
+        balanced {...} span arrives, skipping generation of any trailing
+        prose. Falls back to a regular complete() call otherwise.
+        """
+        stream_fn = getattr(self.llm, "complete_stream", None)
+        if stream_fn is None:
+            return await self.llm.complete(messages, max_tokens=max_tokens, **kwargs)
+
+        chunks: List[str] = []
+        stream = stream_fn(messages, max_tokens=max_tokens, **kwargs)
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+                # Only rescan when a closing brace could have completed the span
+                if '}' in chunk and _find_balanced_json(''.join(chunks)) is not None:
+                    break
+        finally:
+            await stream.aclose()
+
+        return ''.join(chunks)
+
     async def _fetch_data(self, request: AnalysisRequest) -> str:
         """
         Fetch relevant data using available tools.
@@ -178,21 +518,25 @@ Base your response on your area of expertise: {self.name} analysis."""
         """
         if not self.data_tools:
             return "No real-time data available. Use your knowledge base."
-        
+
+        # Run all tools concurrently (async tools on the event loop, sync
+        # tools on the thread pool) - wall time becomes max of tool
+        # latencies instead of their sum
+        results = await asyncio.gather(
+            *(
+                _call_tool_cached(tool, request.symbol, request.trade_date)
+                for tool in self.data_tools
+            ),
+            return_exceptions=True
+        )
+
         data_results = []
-        
-        for tool in self.data_tools:
-            try:
-                # Call data tool
-                result = await asyncio.to_thread(
-                    tool,
-                    request.symbol,
-                    request.trade_date
-                )
+        for tool, result in zip(self.data_tools, results):
+            if isinstance(result, Exception):
+                data_results.append(f"{tool.__name__}: Error - {str(result)}\n")
+            else:
                 data_results.append(f"{tool.__name__}:\n{result}\n")
-            except Exception as e:
-                data_results.append(f"{tool.__name__}: Error - {str(e)}\n")
-        
+
         return "\n".join(data_results) if data_results else "No data fetched."
     
     def _create_analysis_prompt(
@@ -207,85 +551,75 @@ Base your response on your area of expertise: {self.name} analysis."""
         NOTE: This is a MINIMAL prompt that only defines output format.
         All decision logic should come from the controller's dynamic system prompt.
         """
-        prompt = f"""Analyze {request.symbol} for a {request.horizon} investment decision.
+        task_line = f'SPECIFIC TASK: {specific_task}' if specific_task else ''
 
-MARKET CONTEXT: {request.market_context or 'General market conditions'}
-
-{f'SPECIFIC TASK: {specific_task}' if specific_task else ''}
-
-AVAILABLE DATA:
-{data_context}
-
-OUTPUT FORMAT (JSON):
-{{
-    "action": "BUY/SELL/HOLD",
-    "conviction": 0.0-1.0 (your confidence level),
-    "thesis": "Your main argument in 1-2 sentences",
-    "evidence": [
-        "Specific evidence point 1 with exact data",
-        "Specific evidence point 2 with exact data",
-        "..."
-    ]
-}}
-
-Provide your analysis based on your expertise area ({self.name})."""
-
-        return prompt
+        return _ANALYSIS_TEMPLATE.format(
+            symbol=request.symbol,
+            horizon=request.horizon,
+            market_context=request.market_context or 'General market conditions',
+            task_line=task_line,
+            data_context=data_context,
+            name=self.name
+        )
     
     def _format_peer_proposals(
         self,
         peer_proposals: Dict[str, AgentProposal],
         own_proposal: AgentProposal
     ) -> str:
-        """Format peer proposals for debate context."""
-        lines = []
-        
+        """Format peer proposals for debate context.
+
+        Built by extending a parts list with plain fragments and joining
+        once, so looping over many peers doesn't churn intermediate strings.
+        """
+        if not peer_proposals:
+            return "No peer proposals available."
+
         # Separate opposing and supporting
         opposing = []
         supporting = []
-        
+
         for name, prop in peer_proposals.items():
             if self._is_opposing(own_proposal.action, prop.action):
                 opposing.append((name, prop))
             else:
                 supporting.append((name, prop))
-        
+
+        parts: List[str] = []
+
         # Format opposing arguments (focus here)
         if opposing:
-            lines.append("OPPOSING POSITIONS (address these):")
+            parts.append("OPPOSING POSITIONS (address these):")
             for name, prop in opposing:
-                lines.append(f"\n{name.upper()}:")
-                lines.append(f"  Recommends: {prop.action} (conviction: {prop.conviction:.2f})")
-                lines.append(f"  Thesis: {prop.thesis}")
+                parts.extend((
+                    "\n\n", name.upper(),
+                    ":\n  Recommends: ", prop.action,
+                    " (conviction: ", f"{prop.conviction:.2f}",
+                    ")\n  Thesis: ", prop.thesis,
+                ))
                 if prop.evidence:
-                    lines.append(f"  Evidence:")
-                    for ev in prop.evidence[:3]:
-                        lines.append(f"    - {ev}")
-        
+                    parts.append("\n  Evidence:")
+                    for ev in prop.top_evidence:
+                        parts.extend(("\n    - ", ev))
+
         # Format supporting arguments
         if supporting:
-            lines.append("\nSUPPORTING POSITIONS:")
+            parts.append("\n\nSUPPORTING POSITIONS:" if parts else "\nSUPPORTING POSITIONS:")
             for name, prop in supporting:
-                lines.append(f"  {name}: {prop.action} (conviction: {prop.conviction:.2f})")
-        
-        return "\n".join(lines) if lines else "No peer proposals available."
+                parts.extend((
+                    "\n  ", name, ": ", prop.action,
+                    " (conviction: ", f"{prop.conviction:.2f}", ")",
+                ))
+
+        return "".join(parts)
     
     def _is_opposing(self, action1: str, action2: str) -> bool:
-        """Check if two actions are opposing."""
-        action1 = action1.upper()
-        action2 = action2.upper()
-        
-        if action1 == action2:
-            return False
-        
-        # BUY vs SELL is opposing
-        if (action1 == "BUY" and action2 == "SELL") or \
-           (action1 == "SELL" and action2 == "BUY"):
-            return True
-        
-        # HOLD is mildly opposing to active positions
-        return (action1 in ["BUY", "SELL"] and action2 == "HOLD") or \
-               (action1 == "HOLD" and action2 in ["BUY", "SELL"])
+        """Check if two actions are opposing.
+
+        Actions are already upper-cased by AgentProposal.__post_init__, so
+        this is one lookup in the precomputed pair table.
+        """
+        return (action1, action2) in _OPPOSING
     
     def _parse_proposal(self, response: str) -> AgentProposal:
         """
@@ -298,15 +632,19 @@ Provide your analysis based on your expertise area ({self.name})."""
             AgentProposal object
         """
         try:
-            # Try to parse JSON from response
-            data = self._extract_json(response)
+            # Fast path: scan the fixed proposal schema directly; fall back
+            # to the generic extractor on any mismatch
+            data = _fast_parse_proposal(response)
+            if data is None:
+                data = self._extract_json(response)
             
             return AgentProposal(
                 agent=self.name,
                 action=data.get("action", "HOLD"),
                 conviction=float(data.get("conviction", 0.5)),
                 thesis=data.get("thesis", "No thesis provided"),
-                evidence=data.get("evidence", []),
+                # Copy: the parsed dict may come from the shared parse cache
+                evidence=list(data.get("evidence", [])),
                 neutral=False
             )
         except Exception as e:
@@ -322,25 +660,153 @@ Provide your analysis based on your expertise area ({self.name})."""
     
     def _extract_json(self, response: str) -> Dict[str, Any]:
         """Extract JSON from LLM response."""
-        # Try direct parse
+        return _extract_json_cached(response)
+
+
+@lru_cache(maxsize=256)
+def _extract_json_cached(response: str) -> Dict[str, Any]:
+    """
+    Extract JSON from LLM response text.
+
+    Cached so identical responses (retries, debate replays) are parsed once.
+    Callers must treat the returned dict as read-only.
+    """
+    # Direct parse only when the response is bare JSON
+    stripped = response.strip()
+    if stripped.startswith('{'):
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
+            return _json_loads(stripped)
+        except ValueError:
             pass
-        
-        # Try to find JSON in text
-        start = response.find('{')
-        end = response.rfind('}')
-        
-        if start != -1 and end != -1 and end > start:
-            json_str = response[start:end+1]
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
-        
-        # Failed to extract
-        raise ValueError("Could not extract JSON from response")
+
+    # Find the first balanced JSON object embedded in the text
+    json_str = _find_balanced_json(response)
+    if json_str is not None:
+        try:
+            return _json_loads(json_str)
+        except ValueError:
+            pass
+
+    # Failed to extract
+    raise ValueError("Could not extract JSON from response")
+
+
+async def run_agents_parallel(
+    agents: List[TradingAgent],
+    request: AnalysisRequest,
+    **kwargs: Any
+) -> List[AgentProposal]:
+    """
+    Run several agents' analyze() calls concurrently.
+
+    Each analyze() is independent I/O (one LLM round-trip), so firing them in
+    a single gather cuts the analyst phase from the sum of latencies to the
+    max. Extra keyword arguments are forwarded to every agent's analyze().
+
+    Args:
+        agents: Agents to run
+        request: Shared analysis request
+
+    Returns:
+        Proposals in the same order as agents
+    """
+    return await asyncio.gather(*(a.analyze(request, **kwargs) for a in agents))
+
+
+async def analyze_batch(
+    agents: List[TradingAgent],
+    request: AnalysisRequest,
+    preloaded_data: Optional[str] = None,
+    specific_tasks: Optional[Dict[str, str]] = None,
+    dynamic_system_prompts: Optional[Dict[str, str]] = None
+) -> List[AgentProposal]:
+    """
+    Analyze with several agents through one batched LLM call.
+
+    Builds every agent's messages up front and sends them in a single
+    complete_batch call on the shared client, amortizing per-request
+    overhead. If the agents don't share one client, falls back to
+    run_agents_parallel.
+
+    Args:
+        agents: Agents to run
+        request: Shared analysis request
+        preloaded_data: Optional data context shared by all agents
+        specific_tasks: Optional per-agent tasks keyed by agent name
+        dynamic_system_prompts: Optional per-agent system prompts keyed by name
+
+    Returns:
+        Proposals in the same order as agents
+    """
+    specific_tasks = specific_tasks or {}
+    dynamic_system_prompts = dynamic_system_prompts or {}
+
+    if not agents:
+        return []
+
+    llm = agents[0].llm
+    if any(a.llm is not llm for a in agents) or not hasattr(llm, "complete_batch"):
+        # Tasks and system prompts are per-agent, so the fallback forwards
+        # each agent its own values rather than run_agents_parallel's
+        # uniform kwargs
+        return await asyncio.gather(*(
+            agent.analyze(
+                request,
+                specific_task=specific_tasks.get(agent.name),
+                preloaded_data=preloaded_data,
+                dynamic_system_prompt=dynamic_system_prompts.get(agent.name),
+            )
+            for agent in agents
+        ))
+
+    if preloaded_data is not None:
+        contexts = [preloaded_data] * len(agents)
+    else:
+        contexts = await asyncio.gather(*(a._fetch_data(request) for a in agents))
+
+    batch_messages = []
+    for agent, data_context in zip(agents, contexts):
+        prompt = agent._create_analysis_prompt(
+            request, data_context, specific_tasks.get(agent.name)
+        )
+        dynamic = dynamic_system_prompts.get(agent.name)
+        system_msg = {"role": "system", "content": dynamic} if dynamic else agent._system_msg
+        batch_messages.append([system_msg, {"role": "user", "content": prompt}])
+
+    responses = await llm.complete_batch(batch_messages, max_tokens=800)
+    return [agent._parse_proposal(r) for agent, r in zip(agents, responses)]
+
+
+async def run_debate_parallel(
+    agents: List[TradingAgent],
+    proposals: Dict[str, AgentProposal],
+    debate_focus: str,
+    instructions: Dict[str, str],
+    request: AnalysisRequest
+) -> List[AgentProposal]:
+    """
+    Run a debate round for several agents concurrently.
+
+    Args:
+        agents: Agents participating in the debate
+        proposals: Current proposals keyed by agent name
+        debate_focus: Shared focus for this round
+        instructions: Per-agent moderator instructions keyed by agent name
+        request: Original analysis request
+
+    Returns:
+        Revised proposals in the same order as agents
+    """
+    return await asyncio.gather(*(
+        agent.debate(
+            initial_proposal=proposals[agent.name],
+            peer_proposals={k: v for k, v in proposals.items() if k != agent.name},
+            debate_focus=debate_focus,
+            specific_instruction=instructions.get(agent.name, ""),
+            request=request
+        )
+        for agent in agents
+    ))
 
 
 def create_news_agent(llm_client: LLMClient, data_tools: List[Callable]) -> TradingAgent:
@@ -0,0 +1,141 @@
+"""
+Persistent Result Cache
+
+A small sqlite-backed key/value store for memoizing expensive results
+(agent proposals) across process runs. Backtest parameter sweeps replay
+the same (symbol, trade_date, horizon) tuples repeatedly; with a
+persistent cache those reruns skip the LLM entirely.
+
+Opt-in: set PROPOSAL_CACHE_PATH to a file path to enable caching in
+TradingAgent.analyze.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import sqlite3
+import threading
+from collections import Counter
+from typing import Any, List, Optional, Tuple
+
+from .jsonutils import json_dumps_sorted
+
+
+class CacheStore:
+    """Key/value store on sqlite with WAL journaling.
+
+    WAL lets concurrent processes (parallel backtest workers) read while
+    one writes. Values are opaque bytes; callers handle serialization.
+    """
+
+    def __init__(self, path: str) -> None:
+        # check_same_thread=False: the connection is guarded by _lock, and
+        # agent code may touch the cache from thread-pool workers
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value for key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store value under key, replacing any existing entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def text_similarity(a: str, b: str) -> float:
+    """Cosine similarity of two texts over bag-of-words vectors.
+
+    The same comparison SemanticLLMCache uses internally, exposed for
+    one-off checks (e.g. did a thesis meaningfully change between debate
+    rounds). Returns 1.0 for identical texts, 0.0 for disjoint ones.
+    """
+    counts_a, norm_a = SemanticLLMCache._vectorize(a)
+    counts_b, norm_b = SemanticLLMCache._vectorize(b)
+    if norm_a == 0.0 or norm_b == 0.0:
+        return 1.0 if a == b else 0.0
+    dot = sum(c * counts_b.get(tok, 0) for tok, c in counts_a.items())
+    return dot / (norm_a * norm_b)
+
+
+class SemanticLLMCache:
+    """Near-duplicate response cache for LLM prompts.
+
+    Exact hashing misses prompts that differ only in minor formatting -
+    e.g. conviction scores rendered as 0.70 vs 0.7 between runs. This cache
+    compares prompts by cosine similarity over bag-of-words vectors and
+    returns a stored response when similarity meets the threshold. Pure
+    stdlib: at this prompt scale token-count cosine separates "same analysis,
+    different formatting" from genuinely new prompts without an embedding
+    model.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: List[Tuple[Counter, float, str]] = []
+
+    @staticmethod
+    def _vectorize(text: str) -> Tuple[Counter, float]:
+        counts = Counter(text.split())
+        norm = math.sqrt(sum(c * c for c in counts.values()))
+        return counts, norm
+
+    def get(self, text: str) -> Optional[str]:
+        """Return the response of the most similar stored prompt, or None."""
+        if not self._entries:
+            return None
+        counts, norm = self._vectorize(text)
+        if norm == 0.0:
+            return None
+
+        best_score = 0.0
+        best_response = None
+        for other_counts, other_norm, response in self._entries:
+            # Iterate the smaller vector when computing the dot product
+            small, large = (
+                (counts, other_counts)
+                if len(counts) <= len(other_counts) else (other_counts, counts)
+            )
+            dot = sum(c * large.get(tok, 0) for tok, c in small.items())
+            score = dot / (norm * other_norm)
+            if score > best_score:
+                best_score = score
+                best_response = response
+
+        return best_response if best_score >= self.threshold else None
+
+    def put(self, text: str, response: str) -> None:
+        """Store a prompt/response pair, evicting the oldest when full."""
+        counts, norm = self._vectorize(text)
+        if norm == 0.0:
+            return
+        if len(self._entries) >= self.max_entries:
+            self._entries.pop(0)
+        self._entries.append((counts, norm, response))
+
+
+def make_cache_key(**fields: Any) -> str:
+    """Stable hash of keyword fields, for use as a CacheStore key."""
+    payload = json_dumps_sorted(fields)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
@@ -3,9 +3,51 @@ API Configuration Module
 Handles API key setup and validation
 """
 import os
+from dataclasses import dataclass
 from typing import Optional
 
 
+@dataclass(frozen=True, slots=True)
+class ApiConfig:
+    """Immutable snapshot of the API-related environment variables."""
+    openai_key: Optional[str]
+    openrouter_key: Optional[str]
+    use_local: bool
+    use_openrouter: bool
+    local_model: str
+    openrouter_model: str
+
+
+def _load_from_env() -> ApiConfig:
+    """Read the environment once into a frozen snapshot."""
+    return ApiConfig(
+        openai_key=os.environ.get("OPENAI_API_KEY"),
+        openrouter_key=os.environ.get("OPENROUTER_API_KEY"),
+        use_local=os.environ.get("USE_LOCAL_MODEL", "false").lower() == "true",
+        use_openrouter=os.environ.get("USE_OPENROUTER", "false").lower() == "true",
+        local_model=os.environ.get("LOCAL_MODEL", "Qwen/Qwen2.5-7B-Instruct"),
+        openrouter_model=os.environ.get("OPENROUTER_MODEL", "openai/gpt-3.5-turbo"),
+    )
+
+
+# Snapshot taken at import; the setters below refresh it after mutating the
+# environment, so hot paths do attribute reads instead of repeated
+# os.environ lookups.
+_CONFIG = _load_from_env()
+
+
+def refresh_config() -> ApiConfig:
+    """Re-read the environment (call after changing API env vars directly)."""
+    global _CONFIG
+    _CONFIG = _load_from_env()
+    return _CONFIG
+
+
+def get_config() -> ApiConfig:
+    """Get the current configuration snapshot."""
+    return _CONFIG
+
+
 def set_openai_api_key(api_key: str) -> None:
     """
     Set OpenAI API key in environment
@@ -14,6 +56,7 @@ def set_openai_api_key(api_key: str) -> None:
         api_key: Your OpenAI API key
     """
     os.environ["OPENAI_API_KEY"] = api_key
+    refresh_config()
     print(f"✓ OpenAI API key configured (ends with ...{api_key[-4:]})")
 
 
@@ -26,6 +69,7 @@ def set_local_model(model_name: str = "Qwen/Qwen2.5-7B-Instruct") -> None:
     """
     os.environ["USE_LOCAL_MODEL"] = "true"
     os.environ["LOCAL_MODEL"] = model_name
+    refresh_config()
     print(f"✓ Configured to use local model: {model_name}")
 
 
@@ -45,6 +89,7 @@ def set_openrouter_api_key(api_key: str, model: str = "openai/gpt-3.5-turbo") ->
     os.environ["USE_OPENROUTER"] = "true"
     os.environ["OPENROUTER_API_KEY"] = api_key
     os.environ["OPENROUTER_MODEL"] = model
+    refresh_config()
     print(f"✓ OpenRouter configured")
     print(f"  Model: {model}")
     print(f"  API Key: ...{api_key[-4:]}")
@@ -57,7 +102,7 @@ def get_api_key() -> Optional[str]:
     Returns:
         API key or None if not set
     """
-    return os.environ.get("OPENAI_API_KEY")
+    return _CONFIG.openai_key
 
 
 def is_api_configured() -> bool:
@@ -67,10 +112,7 @@ def is_api_configured() -> bool:
     Returns:
         True if API key is set or using local model
     """
-    has_api_key = bool(os.environ.get("OPENAI_API_KEY"))
-    use_local = os.environ.get("USE_LOCAL_MODEL", "false").lower() == "true"
-    
-    return has_api_key or use_local
+    return bool(_CONFIG.openai_key) or _CONFIG.use_local
 
 
 def validate_api_setup() -> tuple[bool, str]:
@@ -80,21 +122,17 @@ def validate_api_setup() -> tuple[bool, str]:
     Returns:
         (is_valid, message) tuple
     """
-    use_local = os.environ.get("USE_LOCAL_MODEL", "false").lower() == "true"
-    use_openrouter = os.environ.get("USE_OPENROUTER", "false").lower() == "true"
-    
-    if use_local:
-        model = os.environ.get("LOCAL_MODEL", "Qwen/Qwen2.5-7B-Instruct")
-        return True, f"Using local model: {model}"
-    
-    if use_openrouter:
-        api_key = os.environ.get("OPENROUTER_API_KEY")
-        model = os.environ.get("OPENROUTER_MODEL", "openai/gpt-3.5-turbo")
-        if not api_key:
+    config = _CONFIG
+
+    if config.use_local:
+        return True, f"Using local model: {config.local_model}"
+
+    if config.use_openrouter:
+        if not config.openrouter_key:
             return False, "OpenRouter API key not set. Use set_openrouter_api_key() or set environment variable."
-        return True, f"Using OpenRouter API with model: {model}"
-    
-    api_key = os.environ.get("OPENAI_API_KEY")
+        return True, f"Using OpenRouter API with model: {config.openrouter_model}"
+
+    api_key = config.openai_key
     if not api_key:
         return False, "OpenAI API key not set. Use set_openai_api_key() or set environment variable."
     
@@ -106,23 +144,20 @@ def validate_api_setup() -> tuple[bool, str]:
 
 def print_api_status() -> None:
     """Print current API configuration status"""
-    use_local = os.environ.get("USE_LOCAL_MODEL", "false").lower() == "true"
-    use_openrouter = os.environ.get("USE_OPENROUTER", "false").lower() == "true"
+    config = _CONFIG
     
     print("=" * 60)
     print("API Configuration Status")
     print("=" * 60)
     
-    if use_local:
-        model = os.environ.get("LOCAL_MODEL", "Qwen/Qwen2.5-7B-Instruct")
+    if config.use_local:
         print(f"Mode: Local Model")
-        print(f"Model: {model}")
-    elif use_openrouter:
-        api_key = os.environ.get("OPENROUTER_API_KEY")
-        model = os.environ.get("OPENROUTER_MODEL", "openai/gpt-3.5-turbo")
+        print(f"Model: {config.local_model}")
+    elif config.use_openrouter:
+        api_key = config.openrouter_key
         if api_key:
             print(f"Mode: OpenRouter API")
-            print(f"Model: {model}")
+            print(f"Model: {config.openrouter_model}")
             print(f"API Key: ...{api_key[-4:]}")
         else:
             print(f"Mode: OpenRouter API")
@@ -131,7 +166,7 @@ def print_api_status() -> None:
             print("  from tradingagents.config_api import set_openrouter_api_key")
             print("  set_openrouter_api_key('your-api-key', 'openai/gpt-4')")
     else:
-        api_key = os.environ.get("OPENAI_API_KEY")
+        api_key = config.openai_key
         if api_key:
             print(f"Mode: OpenAI API")
             print(f"API Key: ...{api_key[-4:]}")
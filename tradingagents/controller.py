@@ -20,10 +20,15 @@ from __future__ import annotations
 
 import asyncio
 import json
-from datetime import datetime
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .cache import CacheStore, SemanticLLMCache, make_cache_key, text_similarity
+from .jsonutils import find_balanced_json, json_dumps, json_loads
 from .llm import LLMClient
 from .models import (
     AnalysisRequest,
@@ -32,9 +37,336 @@ from .models import (
     ControllerPlan,
     EvaluationResult,
     DebateRecord,
-    Trajectory
+    Trajectory,
+    _isoformat_ns,
 )
 
+# How long a cached controller LLM response stays valid. Reruns of the same
+# symbol/date inside this window (parameter sweeps, retries) skip the call.
+_RESPONSE_CACHE_TTL = 3600.0  # seconds
+_RESPONSE_CACHE_MAX = 1024  # entries; expired keys are pruned on insert
+
+# Speculative cutoff for parallel agent execution: once this many agents have
+# answered and one of them is a non-HOLD call at or above this conviction,
+# the stragglers rarely change the decision, so they get cancelled.
+_EARLY_ABORT_CONVICTION = 0.9
+_EARLY_ABORT_MIN_RESULTS = 2
+
+# Upper bound on memoized ControllerPlans (oldest evicted first)
+_PLAN_CACHE_MAX = 1000
+
+# Data-tool results for a given (symbol, trade_date) are reused instead of
+# re-hitting APIs, but they go stale at very different rates: headlines move
+# by the minute, price/indicator data by the hour, company fundamentals by
+# the quarter. TTLs match on a fragment of the tool name so the yfinance,
+# local and CSV variants of each tool share a bucket.
+_DATA_TTL_DEFAULT = 3600.0
+_DATA_TTL_BY_TOOL = (
+    ("news", 600.0),
+    ("price", 3600.0),
+    ("technical", 3600.0),
+    ("company_info", 7 * 86400.0),
+)
+_DATA_CACHE_MAX = 10000
+
+
+def _ttl_for_tool(tool_name: str) -> float:
+    """TTL for a data tool's cached result, bucketed by what it fetches."""
+    for fragment, ttl in _DATA_TTL_BY_TOOL:
+        if fragment in tool_name:
+            return ttl
+    return _DATA_TTL_DEFAULT
+
+
+def _truncate_sections(all_data: str, budget: int = 3000) -> str:
+    """Trim the controller's data excerpt to budget, section by section.
+
+    A flat slice drops whole tail sections whenever an early tool returns a
+    long payload. Splitting on the "=== tool ===" headers and sharing the
+    budget across sections keeps the head of every tool's output instead:
+    short sections are kept whole and their slack goes to the longer ones.
+    Deterministic, so the excerpt - and the prompt built from it - is
+    byte-stable for a given fetch result.
+    """
+    if len(all_data) <= budget:
+        return all_data
+    sections = ["=== " + part for part in all_data.split("=== ") if part]
+    keep = [""] * len(sections)
+    remaining = budget
+    # Visit shortest first so fully-kept sections release budget to the rest
+    order = sorted(range(len(sections)), key=lambda i: len(sections[i]))
+    for rank, i in enumerate(order):
+        share = remaining // (len(sections) - rank)
+        take = min(len(sections[i]), share)
+        keep[i] = sections[i][:take]
+        remaining -= take
+    return "".join(keep)
+
+
+@lru_cache(maxsize=512)
+def _parse_json_str(response: str) -> Dict[str, Any]:
+    """Parse the first JSON object out of an LLM response, memoized.
+
+    Cached and replayed LLM responses push the identical string through the
+    parser many times in a sweep; the memo turns repeats into a dict lookup.
+    Treat the result as read-only - _build_evaluation and _build_decision
+    copy the pieces they keep.
+    """
+    try:
+        # Try direct parse
+        return json_loads(response)
+    except ValueError:
+        # Single forward scan for the first balanced {...} span - no
+        # rfind pass over the whole response
+        json_str = find_balanced_json(response)
+        if json_str is not None:
+            try:
+                return json_loads(json_str)
+            except ValueError:
+                pass
+
+        # Fallback: return empty dict
+        return {}
+
+
+# Opt-in persistent cache for controller LLM responses, shared across
+# processes the way PROPOSAL_CACHE_PATH is for agent proposals. Re-runs on
+# the same symbol/date answer from sqlite instead of the API.
+_LLM_CACHE_PATH = os.environ.get("LLM_CACHE_PATH")
+_llm_cache: Optional[CacheStore] = None
+
+
+def _get_llm_cache() -> Optional[CacheStore]:
+    """Open the shared response cache on first use, if configured."""
+    global _llm_cache
+    if _llm_cache is None and _LLM_CACHE_PATH:
+        _llm_cache = CacheStore(_LLM_CACHE_PATH)
+    return _llm_cache
+
+
+# Static heads of the controller prompts. Keeping all fixed instruction text
+# at the front and appending the per-request data last gives providers a
+# byte-identical prefix to cache (OpenAI/vLLM cache it automatically;
+# Anthropic needs the cacheable_system marker the client attaches).
+
+_PLAN_PROMPT_HEAD = """You are an expert trading analysis coordinator. Create an optimal analysis plan.
+
+AVAILABLE ANALYSTS:
+1. news - Analyzes news events, sentiment, and market-moving announcements
+2. technical - Analyzes price action, technical indicators, and chart patterns
+3. fundamental - Analyzes financial metrics, valuation, and business fundamentals
+
+INSTRUCTIONS:
+1. Decide which analysts are most relevant for this task
+2. Determine execution strategy (parallel or sequential)
+3. Specify what each analyst should focus on
+
+OUTPUT FORMAT (JSON):
+{
+    "selected_agents": ["news", "technical", "fundamental"],
+    "execution_mode": "parallel",
+    "agent_tasks": {
+        "news": "Focus on recent earnings announcements and sector trends",
+        "technical": "Analyze momentum and support/resistance levels",
+        "fundamental": "Evaluate valuation relative to sector peers"
+    },
+    "reasoning": "Brief explanation of plan"
+}
+
+Be strategic - you don't always need all three analysts."""
+
+_EVAL_PROMPT_HEAD = """Evaluate the following trading analysis results.
+
+EVALUATION TASKS:
+1. Identify any conflicts between agents (e.g., BUY vs SELL recommendations)
+2. Assess the strength and credibility of each proposal
+3. Determine if debate would help resolve conflicts
+4. Identify consensus points
+
+OUTPUT FORMAT (JSON):
+{
+    "has_conflict": true/false,
+    "conflict_description": "Description of conflicts",
+    "recommend_debate": true/false,
+    "debate_focus": "What should be debated",
+    "consensus_points": ["List of points where agents agree"],
+    "credibility_ranking": {"agent_name": score_0_to_1},
+    "reasoning": "Your evaluation reasoning"
+}"""
+
+_GUIDANCE_PROMPT_HEAD = """You are moderating a debate between trading analysts.
+
+Generate guidance for the next debate round:
+1. What specific points should be debated?
+2. Which agents should respond to which arguments?
+3. What evidence or data would help resolve conflicts?
+
+OUTPUT FORMAT (JSON):
+{
+    "focus": "Main focus for this round",
+    "questions": ["Specific questions to address"],
+    "agent_instructions": {"agent_name": "What this agent should focus on"}
+}"""
+
+_DECISION_PROMPT_HEAD = """Make the final investment decision.
+
+DECISION REQUIREMENTS:
+1. Recommendation: BUY, SELL, or HOLD
+2. Confidence: 0.0 to 1.0 (based on agreement and evidence strength)
+3. Detailed rationale explaining the decision
+4. Key risks and caveats
+5. Weight given to each analyst
+
+OUTPUT FORMAT (JSON):
+{
+    "recommendation": "BUY/SELL/HOLD",
+    "confidence": 0.75,
+    "rationale": "Detailed explanation",
+    "key_factors": ["Factor 1", "Factor 2"],
+    "risks": ["Risk 1", "Risk 2"],
+    "agent_weights": {"agent_name": weight_0_to_1},
+    "reasoning_process": "How you arrived at this decision"
+}
+
+CRITICAL DECISION PRINCIPLES:
+- Trust your analysts - they are experts who have analyzed the data
+- If 2+ analysts agree on BUY/SELL, strongly consider following their recommendation
+- Higher agreement = higher confidence
+- HOLD should ONLY be used when analysts are genuinely split or all recommend HOLD
+- Don't default to HOLD just to be "safe" - that defeats the purpose of analysis
+- Conflicting signals = evaluate which analyst has stronger evidence, don't just pick HOLD
+- If one analyst says BUY with high conviction (>0.7) and others are neutral, lean BUY
+- If one analyst says SELL with high conviction (>0.7) and others are neutral, lean SELL
+- Strong evidence from multiple sources = higher confidence and should override neutrality"""
+
+_FUSED_PROMPT_HEAD = """Evaluate the following trading analysis results, then make the final investment decision.
+
+First complete the EVALUATION TASKS, then apply the DECISION REQUIREMENTS
+and CRITICAL DECISION PRINCIPLES. If your evaluation recommends a debate,
+still provide your best provisional decision.
+
+EVALUATION TASKS:
+1. Identify any conflicts between agents (e.g., BUY vs SELL recommendations)
+2. Assess the strength and credibility of each proposal
+3. Determine if debate would help resolve conflicts
+4. Identify consensus points
+
+DECISION REQUIREMENTS:
+1. Recommendation: BUY, SELL, or HOLD
+2. Confidence: 0.0 to 1.0 (based on agreement and evidence strength)
+3. Detailed rationale explaining the decision
+4. Key risks and caveats
+5. Weight given to each analyst
+
+OUTPUT FORMAT (JSON):
+{
+    "evaluation": {
+        "has_conflict": true/false,
+        "conflict_description": "Description of conflicts",
+        "recommend_debate": true/false,
+        "debate_focus": "What should be debated",
+        "consensus_points": ["List of points where agents agree"],
+        "credibility_ranking": {"agent_name": score_0_to_1},
+        "reasoning": "Your evaluation reasoning"
+    },
+    "decision": {
+        "recommendation": "BUY/SELL/HOLD",
+        "confidence": 0.75,
+        "rationale": "Detailed explanation",
+        "key_factors": ["Factor 1", "Factor 2"],
+        "risks": ["Risk 1", "Risk 2"],
+        "agent_weights": {"agent_name": weight_0_to_1},
+        "reasoning_process": "How you arrived at this decision"
+    }
+}
+
+CRITICAL DECISION PRINCIPLES:
+- Trust your analysts - they are experts who have analyzed the data
+- If 2+ analysts agree on BUY/SELL, strongly consider following their recommendation
+- Higher agreement = higher confidence
+- HOLD should ONLY be used when analysts are genuinely split or all recommend HOLD
+- Don't default to HOLD just to be "safe" - that defeats the purpose of analysis
+- Conflicting signals = evaluate which analyst has stronger evidence, don't just pick HOLD
+- If one analyst says BUY with high conviction (>0.7) and others are neutral, lean BUY
+- If one analyst says SELL with high conviction (>0.7) and others are neutral, lean SELL
+- Strong evidence from multiple sources = higher confidence and should override neutrality"""
+
+_INSTRUCTIONS_PROMPT_HEAD = """You are the MASTER CONTROLLER for a trading analysis.
+
+You have ALL the market data. Your job is to FULLY CONTROL your specialist agents by giving them:
+1. Their role and decision-making guidelines (system prompt)
+2. Specific analysis task
+3. Which data to focus on"""
+
+_INSTRUCTIONS_PROMPT_BODY = """TASK: For EVERY agent, you MUST generate COMPLETE instructions including:
+
+1. **System Prompt** (REQUIRED): Define their COMPLETE role, expertise, and ALL decision rules for THIS specific case
+   - Include their expertise area (news/technical/fundamental analyst)
+   - BE SPECIFIC: Reference actual data values (e.g., "RSI is at 37.38, which is oversold")
+   - PROVIDE CLEAR RULES: Tell them exactly what to do (e.g., "RSI < 40 suggests BUY, RSI > 70 suggests SELL")
+   - BE DIRECTIVE: Give clear thresholds based on the actual data you see
+   - PUSH FOR ACTION: Tell them when to recommend BUY/SELL vs HOLD based on data
+
+2. **Specific Task** (REQUIRED): What exact question they need to answer
+
+3. **Data Focus** (REQUIRED): Which specific metrics/news/indicators to prioritize
+
+EXAMPLE for a news agent if you see positive news:
+{
+    "news": {
+        "system_prompt": "You are a NEWS SENTIMENT ANALYST. Today's news shows a Citi upgrade maintaining AAPL as top pick. DECISION RULES: Strong positive analyst upgrades from reputable sources (like Citi) indicate BUY signal with conviction 0.7-0.8. Positive AI-related growth news adds +0.1 to conviction. Only recommend HOLD if news is mixed or neutral. Provide clear BUY/SELL recommendations when news is clearly positive/negative.",
+        "specific_task": "Evaluate the trading impact of Citi's reaffirmation and AI growth potential on short-term price action",
+        "data_focus": "Citi upgrade analysis, AI market expansion, analyst confidence"
+    }
+}
+
+OUTPUT FORMAT (JSON):
+{
+    "news": {
+        "system_prompt": "Complete role + decision rules for THIS case",
+        "specific_task": "Exact question to answer",
+        "data_focus": "What data to focus on"
+    },
+    "technical": {
+        "system_prompt": "Complete role + decision rules for THIS case with actual indicator values",
+        "specific_task": "Exact question to answer",
+        "data_focus": "Which indicators to prioritize"
+    },
+    "fundamental": {
+        "system_prompt": "Complete role + decision rules for THIS case with actual valuation metrics",
+        "specific_task": "Exact question to answer",
+        "data_focus": "Which metrics to focus on"
+    },
+    "controller_reasoning": "Your strategic reasoning for these specific instructions"
+}
+
+CRITICAL REQUIREMENTS:
+- EVERY agent MUST have a complete system_prompt with decision rules
+- System prompts MUST reference actual data values you see above
+- System prompts MUST include clear BUY/SELL/HOLD criteria for this specific case
+- NO generic prompts - make them case-specific!"""
+
+
+# Instruction heads of the semantically cached prompts. They are constant
+# across calls, so leaving them in would dominate the bag-of-words token
+# mass and let materially different payloads clear the similarity
+# threshold - near-duplicate matching must see only the variable part.
+_SEMANTIC_PROMPT_HEADS = (
+    _PLAN_PROMPT_HEAD,
+    _EVAL_PROMPT_HEAD,
+    _GUIDANCE_PROMPT_HEAD,
+    _DECISION_PROMPT_HEAD,
+    _FUSED_PROMPT_HEAD,
+)
+
+
+def _semantic_payload(user_content: str) -> str:
+    """Strip the constant instruction head, leaving the variable payload."""
+    for head in _SEMANTIC_PROMPT_HEADS:
+        if user_content.startswith(head):
+            return user_content[len(head):]
+    return user_content
+
 
 class LLMController:
     """
@@ -50,16 +382,24 @@ class LLMController:
         agents: Dict[str, Any],
         max_debate_rounds: int = 2,
         enable_parallel: bool = True,
+        max_concurrent_agents: int = 5,
+        max_inflight_llm_calls: int = 8,
+        trajectory_log_path: Optional[Path] = None,
         verbose: bool = False
     ):
         """
         Initialize the LLM controller.
-        
+
         Args:
             llm_client: LLM client for controller reasoning
             agents: Dictionary of available agents {name: agent_instance}
             max_debate_rounds: Maximum rounds of debate allowed
             enable_parallel: Whether to execute agents in parallel
+            max_concurrent_agents: Cap on simultaneous agent LLM calls
+            max_inflight_llm_calls: Cap on the controller's own simultaneous
+                LLM calls (plan, instructions, evaluation, guidance, decision)
+            trajectory_log_path: Optional NDJSON file that receives each
+                trajectory step as it happens (crash-safe incremental log)
             verbose: Whether to print detailed logs
         """
         self.llm = llm_client
@@ -67,35 +407,246 @@ class LLMController:
         self.max_debate_rounds = max_debate_rounds
         self.enable_parallel = enable_parallel
         self.verbose = verbose
+        # Bounded parallelism: an unbounded gather bursts requests at the
+        # provider, and the resulting 429 retries serialize the whole batch.
+        # A modest cap keeps throughput high without tripping rate limits.
+        self._agent_sem = asyncio.Semaphore(max_concurrent_agents)
+        self._llm_sem = asyncio.Semaphore(max_inflight_llm_calls)
         
         # Trajectory tracking for RL
         self.trajectory = Trajectory()
-    
+        self._trajectory_log_path = trajectory_log_path
+        self._trajectory_log = None
+
+        # Exact-match response cache for the controller's own LLM calls
+        # (plan, instructions, evaluation, guidance, decision). These prompts
+        # repeat across runs for the same symbol/date, and the workload is
+        # dominated by LLM round-trips.
+        self._response_cache: Dict[str, Tuple[float, str]] = {}
+        # Near-duplicate caches for prompts that drift only in formatting or
+        # paraphrasing (plan context, evaluation, decision). One cache per
+        # namespace so a near-match for one symbol can never answer another.
+        self._semantic_caches: Dict[str, SemanticLLMCache] = {}
+        # Plan memo: identical (symbol, horizon, context, date) requests get
+        # the same ControllerPlan back without prompt building or parsing
+        self._plan_cache: Dict[Tuple[str, str, str, str], Tuple[float, ControllerPlan]] = {}
+        # Data-tool result memo keyed by (tool name, symbol, trade_date)
+        self._data_cache: Dict[Tuple[str, str, str], Tuple[float, str]] = {}
+        # In-flight analyses for single-flight coalescing (see analyze)
+        self._inflight_analyses: Dict[Tuple[str, str, str], asyncio.Task] = {}
+        # Dedicated pool for blocking data tools. They hold a thread for a
+        # full network round-trip, so routing them through the interpreter's
+        # default to_thread pool would let a few concurrent analyses starve
+        # everything else that uses it (trajectory saves, agent tool calls).
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=32, thread_name_prefix="ta-io"
+        )
+        # Warm the client's connection (TCP+TLS+auth, or first local
+        # generation) off the critical path so the session's first real call
+        # doesn't pay for it. Constructed outside an event loop, skip: the
+        # first call warms things itself.
+        self._warmup_task: Optional[asyncio.Task] = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            self._warmup_task = loop.create_task(self._warmup())
+        self.stats = {"hits": 0, "misses": 0}
+
+    async def _warmup(self) -> None:
+        """Issue a one-token completion to open the connection early.
+
+        Best-effort: failures are swallowed - real calls surface their own
+        errors, and a dead endpoint shouldn't break construction.
+        """
+        try:
+            await self.llm.complete(
+                [{"role": "user", "content": "ping"}], max_tokens=1
+            )
+        except Exception:
+            pass
+
+    def _cache_response(self, key: str, response: str) -> None:
+        """Insert into the TTL cache, keeping it bounded.
+
+        At the size cap, expired entries are pruned first; if the cache is
+        still full of live entries the oldest insertions are dropped (same
+        discipline as SemanticLLMCache.max_entries).
+        """
+        cache = self._response_cache
+        if len(cache) >= _RESPONSE_CACHE_MAX:
+            now = time.monotonic()
+            for stale in [k for k, (ts, _) in cache.items()
+                          if now - ts >= _RESPONSE_CACHE_TTL]:
+                del cache[stale]
+            while len(cache) >= _RESPONSE_CACHE_MAX:
+                del cache[next(iter(cache))]
+        cache[key] = (time.monotonic(), response)
+
+    async def _llm_cached(
+        self,
+        messages: List[Dict[str, str]],
+        semantic: Optional[str] = None,
+        early_stop: bool = False,
+        **kwargs: Any,
+    ) -> str:
+        """Complete messages via the LLM, serving repeats from the TTL cache.
+
+        With semantic set to a namespace string (e.g. "eval:AAPL"), an
+        exact-hash miss falls through to that namespace's near-duplicate
+        cache before the LLM is called. Scope the namespace to the symbol
+        where the answer is symbol-specific, and only use it for calls
+        where prompt drift is pure formatting or paraphrase - not for
+        debate rebuttals, where small wording changes carry state.
+        """
+        # cacheable_system only marks the prompt prefix for provider-side
+        # caching - it never changes the output, so keep it out of the key
+        key_kwargs = {k: v for k, v in kwargs.items() if k != "cacheable_system"}
+        key = make_cache_key(
+            messages=messages, model=getattr(self.llm, "model", None), **key_kwargs
+        )
+        cached = self._response_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _RESPONSE_CACHE_TTL:
+            self.stats["hits"] += 1
+            return cached[1]
+
+        # Similarity is computed over the variable payload only - the
+        # constant instruction head would otherwise dominate the vector
+        user_content = _semantic_payload(messages[-1].get("content", "")) if semantic else ""
+        if semantic:
+            near_cache = self._semantic_caches.setdefault(semantic, SemanticLLMCache())
+            near = near_cache.get(user_content)
+            if near is not None:
+                self.stats["hits"] += 1
+                self._cache_response(key, near)
+                return near
+
+        store = _get_llm_cache()
+        if store is not None:
+            persisted = store.get(key)
+            if persisted is not None:
+                self.stats["hits"] += 1
+                response = persisted.decode()
+                self._cache_response(key, response)
+                return response
+
+        self.stats["misses"] += 1
+        response = await self._complete(messages, early_stop, **kwargs)
+        self._cache_response(key, response)
+        if store is not None:
+            store.put(key, response.encode())
+        if semantic:
+            near_cache.put(user_content, response)
+        return response
+
+    async def _complete(
+        self,
+        messages: List[Dict[str, str]],
+        early_stop: bool,
+        **kwargs: Any,
+    ) -> str:
+        """Issue the LLM call, optionally stopping at the first complete JSON.
+
+        With early_stop, the response streams and generation is cancelled as
+        soon as a balanced {...} span has arrived - the JSON payload is kept
+        whole (rationale and risks feed the RL trajectory), only trailing
+        prose after it is cut. Same early-stop the agents use for proposals.
+        Falls back to a plain complete() when the client cannot stream.
+        """
+        stream_fn = getattr(self.llm, "complete_stream", None)
+        if not early_stop or stream_fn is None:
+            # Retry transient failures (rate limits, network blips) with the
+            # client's own backoff instead of degrading to a fallback answer
+            retrying = getattr(self.llm, "retrying_complete", None)
+            async with self._llm_sem:
+                if retrying is not None:
+                    return await retrying(messages, **kwargs)
+                return await self.llm.complete(messages, **kwargs)
+
+        chunks: List[str] = []
+        async with self._llm_sem:
+            stream = stream_fn(messages, **kwargs)
+            try:
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    # Only rescan when a closing brace could have completed the span
+                    if "}" in chunk and find_balanced_json("".join(chunks)) is not None:
+                        break
+            finally:
+                await stream.aclose()
+        return "".join(chunks)
+
     async def analyze(self, request: AnalysisRequest) -> Tuple[FinalDecision, Trajectory]:
         """
         Main analysis workflow controlled by LLM.
-        
+
+        Identical concurrent requests are single-flighted: a second
+        analyze() for the same (symbol, trade_date, horizon) while the first
+        is still running awaits the first run's result instead of paying for
+        a duplicate pipeline - the same coalescing the LLM clients apply per
+        request. Sequential repeats are served by the caches instead.
+
         Args:
             request: Analysis request with symbol, horizon, context
             
         Returns:
             Tuple of (final decision, complete trajectory)
         """
+        key = (request.symbol, request.trade_date or "", request.horizon)
+        task = self._inflight_analyses.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._analyze_impl(request))
+            self._inflight_analyses[key] = task
+            task.add_done_callback(
+                lambda _t, _k=key: self._inflight_analyses.pop(_k, None)
+            )
+            return await task
+        # Shield so one caller's cancellation doesn't kill the shared run
+        return await asyncio.shield(task)
+
+    async def _analyze_impl(
+        self, request: AnalysisRequest
+    ) -> Tuple[FinalDecision, Trajectory]:
+        """Run the full pipeline for one request (see analyze)."""
         if self.verbose:
             print(f"\n{'='*60}")
             print(f"Starting LLM-Driven Analysis: {request.symbol}")
             print(f"{'='*60}\n")
         
-        # Step 1: Create analysis plan
-        plan = await self._create_plan(request)
+        # Step 1: Create analysis plan, overlapped with the data fetch.
+        # Neither depends on the other, so the fetch rides inside the plan
+        # LLM round-trip instead of starting after it.
+        plan, all_data = await asyncio.gather(
+            self._create_plan(request),
+            self._fetch_all_data_for_controller(request)
+        )
         self._log_step("plan", plan)
-        
+
         # Step 2: Execute agents according to plan
-        agent_results = await self._execute_agents(plan, request)
+        agent_results = await self._execute_agents(plan, request, all_data)
         self._log_step("agent_execution", agent_results)
         
-        # Step 3: Evaluate results and detect conflicts
-        evaluation = await self._evaluate_results(agent_results, request)
+        # Format proposals once; evaluation, guidance and decision all read
+        # the same rendering, so the block is byte-identical across their
+        # prompts (recomputed only after a debate changes the proposals)
+        proposals_detail = self._format_proposals_detail(agent_results)
+
+        # Step 3: Evaluate results and detect conflicts. When actions
+        # diverge, the evaluation and a provisional decision share one fused
+        # LLM call; the provisional decision is kept unless a debate runs.
+        # When actions agree, the evaluation is synthesized locally with no
+        # LLM call at all - so either branch costs a single round-trip up to
+        # the final decision, and there is nothing left to overlap
+        # speculatively between evaluation and decision.
+        actions = {p.action for p in agent_results.values() if not p.neutral}
+        decision = None
+        if len(actions) <= 1:
+            evaluation = await self._evaluate_results(agent_results, request, proposals_detail)
+        else:
+            evaluation, decision = await self._evaluate_and_decide(
+                agent_results, request, proposals_detail
+            )
         self._log_step("evaluation", evaluation)
         
         # Step 4: Conduct debate if needed
@@ -107,11 +658,14 @@ class LLMController:
                 agent_results, evaluation, request
             )
             self._log_step("debate_results", agent_results)
+            proposals_detail = self._format_proposals_detail(agent_results)
+            decision = None  # provisional decision predates the debate
         
-        # Step 5: Make final decision
-        decision = await self._make_final_decision(
-            agent_results, evaluation, request
-        )
+        # Step 5: Make final decision (unless the fused call already did)
+        if decision is None:
+            decision = await self._make_final_decision(
+                agent_results, evaluation, request, proposals_detail
+            )
         self._log_step("final_decision", decision)
         
         if self.verbose:
@@ -130,39 +684,28 @@ class LLMController:
         - Execution order (parallel or sequential)
         - Specific tasks for each agent
         """
-        prompt = f"""You are an expert trading analysis coordinator. Create an optimal analysis plan.
-
-TASK: Analyze {request.symbol} for {request.horizon} investment decision
-MARKET CONTEXT: {request.market_context or 'General market conditions'}
-
-AVAILABLE ANALYSTS:
-1. news - Analyzes news events, sentiment, and market-moving announcements
-2. technical - Analyzes price action, technical indicators, and chart patterns  
-3. fundamental - Analyzes financial metrics, valuation, and business fundamentals
+        # Same symbol/horizon/context on the same trade date yields the same
+        # plan - the LLM has nothing new to reason about. Serve it from memory.
+        plan_key = (
+            request.symbol,
+            request.horizon,
+            (request.market_context or "")[:100],
+            request.trade_date or ""
+        )
+        cached = self._plan_cache.get(plan_key)
+        if cached is not None and time.monotonic() - cached[0] < _RESPONSE_CACHE_TTL:
+            self.stats["hits"] += 1
+            return cached[1]
 
-INSTRUCTIONS:
-1. Decide which analysts are most relevant for this task
-2. Determine execution strategy (parallel or sequential)
-3. Specify what each analyst should focus on
+        prompt = f"""{_PLAN_PROMPT_HEAD}
 
-OUTPUT FORMAT (JSON):
-{{
-    "selected_agents": ["news", "technical", "fundamental"],
-    "execution_mode": "parallel",
-    "agent_tasks": {{
-        "news": "Focus on recent earnings announcements and sector trends",
-        "technical": "Analyze momentum and support/resistance levels",
-        "fundamental": "Evaluate valuation relative to sector peers"
-    }},
-    "reasoning": "Brief explanation of plan"
-}}
-
-Be strategic - you don't always need all three analysts."""
+TASK: Analyze {request.symbol} for {request.horizon} investment decision
+MARKET CONTEXT: {request.market_context or 'General market conditions'}"""
 
-        response = await self.llm.complete([
+        response = await self._llm_cached([
             {"role": "system", "content": "You are a strategic trading analysis coordinator."},
             {"role": "user", "content": prompt}
-        ])
+        ], semantic=f"plan:{request.symbol}:{request.horizon}", cacheable_system=True, json_mode=True)
         
         plan_data = self._parse_json_response(response)
         
@@ -177,7 +720,11 @@ Be strategic - you don't always need all three analysts."""
             agent_tasks=plan_data.get("agent_tasks", {}),
             reasoning=plan_data.get("reasoning", "")
         )
-        
+
+        if len(self._plan_cache) >= _PLAN_CACHE_MAX:
+            self._plan_cache.pop(next(iter(self._plan_cache)))
+        self._plan_cache[plan_key] = (time.monotonic(), plan)
+
         if self.verbose:
             print(f"[PLAN] Selected agents: {', '.join(plan.selected_agents)}")
             print(f"[PLAN] Execution mode: {plan.execution_mode}")
@@ -193,23 +740,40 @@ Be strategic - you don't always need all three analysts."""
         Returns:
             Formatted string with all available data
         """
-        data_sections = []
-        
-        # Fetch from all agent tools
-        for agent_name, agent in self.agents.items():
-            if hasattr(agent, 'data_tools') and agent.data_tools:
-                for tool in agent.data_tools:
-                    try:
-                        import asyncio
-                        result = await asyncio.to_thread(
-                            tool,
-                            request.symbol,
-                            request.trade_date
-                        )
-                        data_sections.append(f"=== {tool.__name__} ===\n{result}\n")
-                    except Exception as e:
-                        data_sections.append(f"=== {tool.__name__} ===\nError: {str(e)}\n")
-        
+        # Collect each distinct tool once (agents may share tools), keeping
+        # first-seen order so the assembled data string stays stable
+        tools = []
+        seen = set()
+        for agent in self.agents.values():
+            for tool in getattr(agent, "data_tools", None) or []:
+                if id(tool) not in seen:
+                    seen.add(id(tool))
+                    tools.append(tool)
+
+        async def fetch(tool) -> str:
+            key = (tool.__name__, request.symbol, request.trade_date or "")
+            cached = self._data_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < _ttl_for_tool(tool.__name__):
+                return cached[1]
+            try:
+                if asyncio.iscoroutinefunction(tool):
+                    result = await tool(request.symbol, request.trade_date)
+                else:
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        self._io_executor, tool, request.symbol, request.trade_date
+                    )
+            except Exception as e:
+                # Failures are not cached - the next analysis retries the API
+                return f"=== {tool.__name__} ===\nError: {str(e)}\n"
+            section = f"=== {tool.__name__} ===\n{result}\n"
+            if len(self._data_cache) >= _DATA_CACHE_MAX:
+                self._data_cache.pop(next(iter(self._data_cache)))
+            self._data_cache[key] = (time.monotonic(), section)
+            return section
+
+        # Tools are network I/O; issuing them together makes the fetch phase
+        # cost the slowest tool instead of the sum of all of them
+        data_sections = await asyncio.gather(*(fetch(tool) for tool in tools))
         return "\n".join(data_sections)
     
     async def _generate_dynamic_agent_instructions(
@@ -231,72 +795,23 @@ Be strategic - you don't always need all three analysts."""
                 "data_focus": "Which parts of data to focus on"
             }}
         """
-        prompt = f"""You are the MASTER CONTROLLER analyzing {request.symbol} for a {request.horizon} investment decision.
+        prompt = f"""{_INSTRUCTIONS_PROMPT_HEAD}
 
-You have ALL the market data. Your job is to FULLY CONTROL your specialist agents by giving them:
-1. Their role and decision-making guidelines (system prompt)
-2. Specific analysis task
-3. Which data to focus on
+TARGET: {request.symbol} for a {request.horizon} investment decision
 
 === AVAILABLE DATA ===
-{all_data[:3000]}  
+{_truncate_sections(all_data)}
 
 === SELECTED AGENTS ===
 {', '.join(plan.selected_agents)}
 
-TASK: For EVERY agent, you MUST generate COMPLETE instructions including:
-
-1. **System Prompt** (REQUIRED): Define their COMPLETE role, expertise, and ALL decision rules for THIS specific case
-   - Include their expertise area (news/technical/fundamental analyst)
-   - BE SPECIFIC: Reference actual data values (e.g., "RSI is at 37.38, which is oversold")
-   - PROVIDE CLEAR RULES: Tell them exactly what to do (e.g., "RSI < 40 suggests BUY, RSI > 70 suggests SELL")
-   - BE DIRECTIVE: Give clear thresholds based on the actual data you see
-   - PUSH FOR ACTION: Tell them when to recommend BUY/SELL vs HOLD based on data
-
-2. **Specific Task** (REQUIRED): What exact question they need to answer
-
-3. **Data Focus** (REQUIRED): Which specific metrics/news/indicators to prioritize
-
-EXAMPLE for a news agent if you see positive news:
-{{
-    "news": {{
-        "system_prompt": "You are a NEWS SENTIMENT ANALYST. Today's news shows a Citi upgrade maintaining AAPL as top pick. DECISION RULES: Strong positive analyst upgrades from reputable sources (like Citi) indicate BUY signal with conviction 0.7-0.8. Positive AI-related growth news adds +0.1 to conviction. Only recommend HOLD if news is mixed or neutral. Provide clear BUY/SELL recommendations when news is clearly positive/negative.",
-        "specific_task": "Evaluate the trading impact of Citi's reaffirmation and AI growth potential on short-term price action",
-        "data_focus": "Citi upgrade analysis, AI market expansion, analyst confidence"
-    }}
-}}
-
-OUTPUT FORMAT (JSON):
-{{
-    "news": {{
-        "system_prompt": "Complete role + decision rules for THIS case",
-        "specific_task": "Exact question to answer",
-        "data_focus": "What data to focus on"
-    }},
-    "technical": {{
-        "system_prompt": "Complete role + decision rules for THIS case with actual indicator values",
-        "specific_task": "Exact question to answer",  
-        "data_focus": "Which indicators to prioritize"
-    }},
-    "fundamental": {{
-        "system_prompt": "Complete role + decision rules for THIS case with actual valuation metrics",
-        "specific_task": "Exact question to answer",
-        "data_focus": "Which metrics to focus on"
-    }},
-    "controller_reasoning": "Your strategic reasoning for these specific instructions"
-}}
-
-CRITICAL REQUIREMENTS:
-- EVERY agent MUST have a complete system_prompt with decision rules
-- System prompts MUST reference actual data values you see above
-- System prompts MUST include clear BUY/SELL/HOLD criteria for this specific case
-- NO generic prompts - make them case-specific!
+{_INSTRUCTIONS_PROMPT_BODY}
 Only include instructions for selected agents: {plan.selected_agents}"""
 
-        response = await self.llm.complete([
+        response = await self._llm_cached([
             {"role": "system", "content": "You are the master controller with full authority over agent behavior."},
             {"role": "user", "content": prompt}
-        ], max_tokens=1500)
+        ], max_tokens=1500, json_mode=True)
         
         instructions = self._parse_json_response(response)
         
@@ -308,65 +823,85 @@ Only include instructions for selected agents: {plan.selected_agents}"""
         return instructions
     
     async def _execute_agents(
-        self, 
-        plan: ControllerPlan, 
-        request: AnalysisRequest
+        self,
+        plan: ControllerPlan,
+        request: AnalysisRequest,
+        all_data: str
     ) -> Dict[str, AgentProposal]:
         """
         Execute agents with FULL controller control.
-        
+
         REVOLUTIONARY APPROACH:
-        1. Controller fetches ALL data ONCE
+        1. Controller fetches ALL data ONCE (concurrently with planning, in analyze)
         2. Controller analyzes data and generates COMPLETE instructions for each agent
            - Dynamic system prompts (role + decision rules based on THIS data)
            - Specific tasks
            - Data focus areas
         3. Agents receive: preloaded data + dynamic system prompt + specific task
         4. Agents just execute instructions (become simple tools)
-        
+
         Controller is now the TRUE brain!
-        
+
         Args:
             plan: Analysis plan from LLM
             request: Analysis request
-            
+            all_data: Market data prefetched by the caller
+
         Returns:
             Dictionary of agent proposals
         """
-        # Step 1: Fetch all data for controller (ONCE)
-        if self.verbose:
-            print(f"[CONTROLLER] Fetching all data...")
-        
-        all_data = await self._fetch_all_data_for_controller(request)
-        
-        # Step 2: Controller generates COMPLETE instructions (system prompts + tasks)
+        # Step 1: Controller generates COMPLETE instructions (system prompts + tasks)
         instructions = await self._generate_dynamic_agent_instructions(plan, all_data, request)
         
-        # Step 3: Execute agents with full controller control
+        # Step 2: Execute agents with full controller control
         results = {}
         
         if plan.execution_mode == "parallel" and self.enable_parallel:
             # Execute all agents in parallel with controller instructions
-            tasks = []
+            pending = set()
             for agent_name in plan.selected_agents:
                 agent = self.agents[agent_name]
                 agent_instructions = instructions.get(agent_name, {})
-                
+
                 # Extract controller-generated components
                 dynamic_system_prompt = agent_instructions.get("system_prompt")
                 specific_task = agent_instructions.get("specific_task")
-                
-                tasks.append(self._run_agent_safe(
-                    agent, 
-                    request, 
+
+                pending.add(asyncio.create_task(self._run_agent_limited(
+                    agent,
+                    request,
                     specific_task=specific_task,
                     preloaded_data=all_data,
                     dynamic_system_prompt=dynamic_system_prompt
-                ))
-            
-            proposals = await asyncio.gather(*tasks)
-            results = {p.agent: p for p in proposals if p is not None}
-            
+                )))
+
+            # Collect results as they land; a decisive early signal makes
+            # waiting on the slowest agent pointless, so cancel stragglers
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    proposal = task.result()
+                    if proposal is not None:
+                        results[proposal.agent] = proposal
+
+                if pending and len(results) >= _EARLY_ABORT_MIN_RESULTS and any(
+                    p.conviction >= _EARLY_ABORT_CONVICTION and p.action != "HOLD"
+                    for p in results.values()
+                ):
+                    if self.verbose:
+                        print(
+                            f"[EXECUTION] Decisive signal received - "
+                            f"cancelling {len(pending)} slower agent(s)"
+                        )
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    pending = set()
+
         else:
             # Execute agents sequentially
             for agent_name in plan.selected_agents:
@@ -391,6 +926,11 @@ Only include instructions for selected agents: {plan.selected_agents}"""
         
         return results
     
+    async def _run_agent_limited(self, *args: Any, **kwargs: Any) -> Optional[AgentProposal]:
+        """Run an agent under the shared concurrency cap."""
+        async with self._agent_sem:
+            return await self._run_agent_safe(*args, **kwargs)
+
     async def _run_agent_safe(
         self, 
         agent: Any, 
@@ -440,79 +980,157 @@ Only include instructions for selected agents: {plan.selected_agents}"""
             )
     
     async def _evaluate_results(
-        self, 
+        self,
         agent_results: Dict[str, AgentProposal],
-        request: AnalysisRequest
+        request: AnalysisRequest,
+        proposals_detail: Optional[str] = None
     ) -> EvaluationResult:
         """
         Use LLM to evaluate agent results and detect conflicts.
-        
+
         Args:
             agent_results: Proposals from agents
             request: Original request
-            
+            proposals_detail: Preformatted proposals (rendered here if absent)
+
         Returns:
             Evaluation with conflict detection and recommendations
         """
-        # Format agent results for LLM
-        results_summary = []
-        for name, proposal in agent_results.items():
-            results_summary.append({
-                "agent": name,
-                "action": proposal.action,
-                "conviction": proposal.conviction,
-                "thesis": proposal.thesis,
-                "evidence_count": len(proposal.evidence)
-            })
-        
-        prompt = f"""Evaluate the following trading analysis results for {request.symbol}.
+        # Trivial consensus needs no LLM: when every non-neutral agent lands
+        # on the same action (or only HOLDs remain), there is nothing to
+        # debate, so skip the evaluation round-trip entirely
+        actions = {p.action for p in agent_results.values() if not p.neutral}
+        if len(actions) <= 1:
+            consensus = (
+                [f"All agents agree on {next(iter(actions))}"] if actions else []
+            )
+            return EvaluationResult(
+                has_conflict=False,
+                recommend_debate=False,
+                consensus_points=consensus,
+                credibility_ranking={
+                    name: p.conviction for name, p in agent_results.items()
+                },
+                reasoning="Trivial consensus - LLM evaluation skipped"
+            )
 
-AGENT PROPOSALS:
-{json.dumps(results_summary, indent=2)}
+        if proposals_detail is None:
+            proposals_detail = self._format_proposals_detail(agent_results)
 
-DETAILED ANALYSIS:
-{self._format_proposals_detail(agent_results)}
+        prompt = f"""{_EVAL_PROMPT_HEAD}
 
-EVALUATION TASKS:
-1. Identify any conflicts between agents (e.g., BUY vs SELL recommendations)
-2. Assess the strength and credibility of each proposal
-3. Determine if debate would help resolve conflicts
-4. Identify consensus points
+SYMBOL: {request.symbol}
 
-OUTPUT FORMAT (JSON):
-{{
-    "has_conflict": true/false,
-    "conflict_description": "Description of conflicts",
-    "recommend_debate": true/false,
-    "debate_focus": "What should be debated",
-    "consensus_points": ["List of points where agents agree"],
-    "credibility_ranking": {{"agent_name": score_0_to_1}},
-    "reasoning": "Your evaluation reasoning"
-}}"""
+AGENT PROPOSALS (agent|action|conviction|evidence count):
+{self._format_results_table(agent_results)}
+
+DETAILED ANALYSIS:
+{proposals_detail}"""
 
-        response = await self.llm.complete([
+        response = await self._llm_cached([
             {"role": "system", "content": "You are an expert at evaluating trading analyses and identifying conflicts."},
             {"role": "user", "content": prompt}
-        ])
+        ], semantic=f"eval:{request.symbol}", cacheable_system=True, json_mode=True)
         
-        eval_data = self._parse_json_response(response)
+        evaluation = self._build_evaluation(self._parse_json_response(response))
+
+        if self.verbose and evaluation.has_conflict:
+            print(f"[EVALUATION] Conflict detected: {evaluation.conflict_description}")
+            print(f"[EVALUATION] Recommend debate: {evaluation.recommend_debate}\n")
         
-        evaluation = EvaluationResult(
+        return evaluation
+
+    async def _evaluate_and_decide(
+        self,
+        agent_results: Dict[str, AgentProposal],
+        request: AnalysisRequest,
+        proposals_detail: Optional[str] = None
+    ) -> Tuple[EvaluationResult, Optional[FinalDecision]]:
+        """
+        Evaluate proposals and make a provisional decision in one LLM call.
+
+        The evaluation and decision prompts overlap almost entirely - both
+        list the proposals and market context - so when both are needed the
+        fused call halves the round-trips. The decision half is provisional:
+        analyze() discards it when the evaluation leads to a debate.
+
+        Args:
+            agent_results: Proposals from agents
+            request: Original request
+            proposals_detail: Preformatted proposals (rendered here if absent)
+
+        Returns:
+            (evaluation, decision) - decision is None if the response
+            lacked a usable decision section
+        """
+        if proposals_detail is None:
+            proposals_detail = self._format_proposals_detail(agent_results)
+
+        prompt = f"""{_FUSED_PROMPT_HEAD}
+
+SYMBOL: {request.symbol} ({request.horizon} horizon)
+
+AGENT PROPOSALS (agent|action|conviction|evidence count):
+{self._format_results_table(agent_results)}
+
+DETAILED ANALYSIS:
+{proposals_detail}
+
+MARKET CONTEXT: {request.market_context or 'N/A'}"""
+
+        response = await self._llm_cached([
+            {"role": "system", "content": "You are an expert at evaluating trading analyses and making final investment decisions."},
+            {"role": "user", "content": prompt}
+        ], semantic=f"fused:{request.symbol}", early_stop=True, cacheable_system=True, json_mode=True)
+
+        data = self._parse_json_response(response)
+        evaluation = self._build_evaluation(data.get("evaluation", {}))
+
+        decision_data = data.get("decision") or {}
+        decision = (
+            self._build_decision(decision_data, agent_results, evaluation, request)
+            if decision_data else None
+        )
+
+        if self.verbose and evaluation.has_conflict:
+            print(f"[EVALUATION] Conflict detected: {evaluation.conflict_description}")
+            print(f"[EVALUATION] Recommend debate: {evaluation.recommend_debate}\n")
+
+        return evaluation, decision
+
+    def _build_evaluation(self, eval_data: Dict[str, Any]) -> EvaluationResult:
+        """Construct an EvaluationResult from parsed LLM output."""
+        return EvaluationResult(
             has_conflict=eval_data.get("has_conflict", False),
             conflict_description=eval_data.get("conflict_description", ""),
             recommend_debate=eval_data.get("recommend_debate", False),
             debate_focus=eval_data.get("debate_focus", ""),
-            consensus_points=eval_data.get("consensus_points", []),
-            credibility_ranking=eval_data.get("credibility_ranking", {}),
+            consensus_points=list(eval_data.get("consensus_points", [])),
+            credibility_ranking=dict(eval_data.get("credibility_ranking", {})),
             reasoning=eval_data.get("reasoning", "")
         )
-        
-        if self.verbose and evaluation.has_conflict:
-            print(f"[EVALUATION] Conflict detected: {evaluation.conflict_description}")
-            print(f"[EVALUATION] Recommend debate: {evaluation.recommend_debate}\n")
-        
-        return evaluation
-    
+
+    def _build_decision(
+        self,
+        decision_data: Dict[str, Any],
+        agent_results: Dict[str, AgentProposal],
+        evaluation: EvaluationResult,
+        request: AnalysisRequest
+    ) -> FinalDecision:
+        """Construct a FinalDecision from parsed LLM output."""
+        return FinalDecision(
+            symbol=request.symbol,
+            horizon=request.horizon,
+            recommendation=decision_data.get("recommendation", "HOLD"),
+            confidence=float(decision_data.get("confidence", 0.5)),
+            rationale=decision_data.get("rationale", ""),
+            key_factors=list(decision_data.get("key_factors", [])),
+            risks=list(decision_data.get("risks", [])),
+            agent_weights=dict(decision_data.get("agent_weights", {})),
+            agent_proposals=agent_results,
+            evaluation=evaluation
+        )
+
     async def _conduct_debate(
         self,
         agent_results: Dict[str, AgentProposal],
@@ -534,12 +1152,21 @@ OUTPUT FORMAT (JSON):
         current_results = dict(agent_results)
         
         for round_num in range(self.max_debate_rounds):
+            # The evaluation can recommend a debate off a split that is
+            # already compatible (or became so last round). The set check is
+            # free and saves the round's guidance and rebuttal LLM calls.
+            if self._actions_agree(current_results):
+                if self.verbose:
+                    print("[DEBATE] Positions already compatible - no round needed")
+                break
+
             if self.verbose:
                 print(f"\n[DEBATE] Round {round_num + 1}/{self.max_debate_rounds}")
-            
+
             # Generate debate guidance from LLM
             guidance = await self._generate_debate_guidance(
-                current_results, evaluation, debate_history, round_num
+                current_results, evaluation, debate_history, round_num,
+                request.symbol, self._format_proposals_detail(current_results)
             )
             
             if self.verbose:
@@ -579,37 +1206,30 @@ OUTPUT FORMAT (JSON):
         results: Dict[str, AgentProposal],
         evaluation: EvaluationResult,
         history: List[Dict],
-        round_num: int
+        round_num: int,
+        symbol: str,
+        proposals_detail: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate LLM guidance for debate round.
         """
-        prompt = f"""You are moderating a debate between trading analysts.
+        if proposals_detail is None:
+            proposals_detail = self._format_proposals_detail(results)
+        prompt = f"""{_GUIDANCE_PROMPT_HEAD}
 
 CURRENT POSITIONS:
-{self._format_proposals_detail(results)}
+{proposals_detail}
 
 CONFLICT: {evaluation.conflict_description}
 FOCUS AREA: {evaluation.debate_focus}
 
 PREVIOUS DEBATE ROUNDS: {len(history)}
+THIS IS ROUND: {round_num + 1}"""
 
-Generate guidance for debate round {round_num + 1}:
-1. What specific points should be debated?
-2. Which agents should respond to which arguments?
-3. What evidence or data would help resolve conflicts?
-
-OUTPUT FORMAT (JSON):
-{{
-    "focus": "Main focus for this round",
-    "questions": ["Specific questions to address"],
-    "agent_instructions": {{"agent_name": "What this agent should focus on"}}
-}}"""
-
-        response = await self.llm.complete([
+        response = await self._llm_cached([
             {"role": "system", "content": "You are an expert debate moderator for trading analysis."},
             {"role": "user", "content": prompt}
-        ])
+        ], semantic=f"guidance:{symbol}:r{round_num}", cacheable_system=True, json_mode=True)
         
         return self._parse_json_response(response)
     
@@ -621,127 +1241,96 @@ OUTPUT FORMAT (JSON):
     ) -> Dict[str, AgentProposal]:
         """
         Get agent rebuttals in debate.
+
+        Rebuttals are independent LLM round-trips, so each round awaits them
+        together: the round takes as long as the slowest rebuttal rather
+        than their sum. Each rebuttal runs under the shared agent-concurrency
+        cap and keeps the agent's prior proposal if its debate call fails.
         """
-        updated = {}
-        
-        # Prepare context for each agent
-        for agent_name, current_proposal in current_results.items():
+        agent_instructions = guidance.get("agent_instructions", {})
+        debate_focus = guidance.get("focus", "")
+
+        async def rebut(agent_name: str, current_proposal: AgentProposal):
             agent = self.agents.get(agent_name)
             if not agent:
-                continue
-            
-            # Get other agents' positions
+                return None
+
+            # Other agents' positions
             peer_proposals = {k: v for k, v in current_results.items() if k != agent_name}
-            
-            # Get specific instruction for this agent
-            instruction = guidance.get("agent_instructions", {}).get(agent_name, "")
-            
+
             try:
-                # Agent responds to debate
-                revised_proposal = await agent.debate(
-                    initial_proposal=current_proposal,
-                    peer_proposals=peer_proposals,
-                    debate_focus=guidance.get("focus", ""),
-                    specific_instruction=instruction,
-                    request=request
-                )
-                
-                updated[agent_name] = revised_proposal
-                
-                if self.verbose:
-                    action_changed = revised_proposal.action != current_proposal.action
-                    conv_change = revised_proposal.conviction - current_proposal.conviction
-                    print(f"  [{agent_name.upper()}] " + 
-                          f"{'Changed to ' + revised_proposal.action if action_changed else revised_proposal.action} " +
-                          f"(Δconv: {conv_change:+.2f})")
-                
+                # Agent responds to debate, under the same concurrency cap
+                # as initial agent execution
+                async with self._agent_sem:
+                    revised_proposal = await agent.debate(
+                        initial_proposal=current_proposal,
+                        peer_proposals=peer_proposals,
+                        debate_focus=debate_focus,
+                        specific_instruction=agent_instructions.get(agent_name, ""),
+                        request=request
+                    )
             except Exception as e:
                 if self.verbose:
                     print(f"  [{agent_name.upper()}] Debate failed: {str(e)}")
-                updated[agent_name] = current_proposal  # Keep original
-        
-        return updated
+                return agent_name, current_proposal  # Keep original
+
+            if self.verbose:
+                action_changed = revised_proposal.action != current_proposal.action
+                conv_change = revised_proposal.conviction - current_proposal.conviction
+                print(f"  [{agent_name.upper()}] " +
+                      f"{'Changed to ' + revised_proposal.action if action_changed else revised_proposal.action} " +
+                      f"(Δconv: {conv_change:+.2f})")
+            return agent_name, revised_proposal
+
+        rebuttals = await asyncio.gather(
+            *(rebut(name, prop) for name, prop in current_results.items())
+        )
+
+        return {name: prop for item in rebuttals if item is not None for name, prop in (item,)}
     
     async def _make_final_decision(
         self,
         agent_results: Dict[str, AgentProposal],
         evaluation: EvaluationResult,
-        request: AnalysisRequest
+        request: AnalysisRequest,
+        proposals_detail: Optional[str] = None
     ) -> FinalDecision:
         """
         LLM makes final investment decision.
-        
+
         Args:
             agent_results: Final agent proposals
             evaluation: Evaluation result
             request: Original request
-            
+            proposals_detail: Preformatted proposals (rendered here if absent)
+
         Returns:
             Final decision with recommendation and confidence
         """
-        prompt = f"""Make the final investment decision for {request.symbol} ({request.horizon} horizon).
+        if proposals_detail is None:
+            proposals_detail = self._format_proposals_detail(agent_results)
+        prompt = f"""{_DECISION_PROMPT_HEAD}
+
+TASK: Decide for {request.symbol} ({request.horizon} horizon).
 
 ANALYST RECOMMENDATIONS:
-{self._format_proposals_detail(agent_results)}
+{proposals_detail}
 
 EVALUATION:
 - Conflicts: {evaluation.conflict_description or 'None'}
 - Consensus: {', '.join(evaluation.consensus_points) if evaluation.consensus_points else 'None'}
-- Credibility ranking: {json.dumps(evaluation.credibility_ranking, indent=2)}
-
-MARKET CONTEXT: {request.market_context or 'N/A'}
-
-DECISION REQUIREMENTS:
-1. Recommendation: BUY, SELL, or HOLD
-2. Confidence: 0.0 to 1.0 (based on agreement and evidence strength)
-3. Detailed rationale explaining the decision
-4. Key risks and caveats
-5. Weight given to each analyst
+- Credibility ranking: {json.dumps(evaluation.credibility_ranking, separators=(',', ':'))}
 
-OUTPUT FORMAT (JSON):
-{{
-    "recommendation": "BUY/SELL/HOLD",
-    "confidence": 0.75,
-    "rationale": "Detailed explanation",
-    "key_factors": ["Factor 1", "Factor 2"],
-    "risks": ["Risk 1", "Risk 2"],
-    "agent_weights": {{"agent_name": weight_0_to_1}},
-    "reasoning_process": "How you arrived at this decision"
-}}
+MARKET CONTEXT: {request.market_context or 'N/A'}"""
 
-CRITICAL DECISION PRINCIPLES:
-- Trust your analysts - they are experts who have analyzed the data
-- If 2+ analysts agree on BUY/SELL, strongly consider following their recommendation
-- Higher agreement = higher confidence
-- HOLD should ONLY be used when analysts are genuinely split or all recommend HOLD
-- Don't default to HOLD just to be "safe" - that defeats the purpose of analysis
-- Conflicting signals = evaluate which analyst has stronger evidence, don't just pick HOLD
-- If one analyst says BUY with high conviction (>0.7) and others are neutral, lean BUY
-- If one analyst says SELL with high conviction (>0.7) and others are neutral, lean SELL
-- Strong evidence from multiple sources = higher confidence and should override neutrality"""
-
-        response = await self.llm.complete([
+        response = await self._llm_cached([
             {"role": "system", "content": "You are an expert portfolio manager making final investment decisions."},
             {"role": "user", "content": prompt}
-        ])
+        ], semantic=f"decision:{request.symbol}", early_stop=True, cacheable_system=True, json_mode=True)
         
         decision_data = self._parse_json_response(response)
-        
-        decision = FinalDecision(
-            symbol=request.symbol,
-            horizon=request.horizon,
-            recommendation=decision_data.get("recommendation", "HOLD"),
-            confidence=float(decision_data.get("confidence", 0.5)),
-            rationale=decision_data.get("rationale", ""),
-            key_factors=decision_data.get("key_factors", []),
-            risks=decision_data.get("risks", []),
-            agent_weights=decision_data.get("agent_weights", {}),
-            agent_proposals=agent_results,
-            evaluation=evaluation,
-            timestamp=datetime.utcnow().isoformat()
-        )
-        
-        return decision
+
+        return self._build_decision(decision_data, agent_results, evaluation, request)
     
     def _check_convergence(
         self,
@@ -750,49 +1339,127 @@ CRITICAL DECISION PRINCIPLES:
     ) -> bool:
         """
         Check if agents have converged (no more conflicts).
+
+        Two signals end a debate early: agreement - all actionable agents
+        recommend the same action - and stability - no position moved
+        meaningfully since the last round (same action, conviction within
+        0.05, essentially unchanged thesis). Stability catches what the
+        action-set comparison alone missed: an agent that keeps its action
+        while its conviction is still swinging is not done debating, and
+        conversely agents frozen in disagreement gain nothing from more
+        rounds.
         """
-        # Get unique actions (excluding HOLD)
-        before_actions = {p.action for p in before.values() if p.action != "HOLD"}
-        after_actions = {p.action for p in after.values() if p.action != "HOLD"}
-        
-        # Converged if all actionable agents agree
-        return len(after_actions) <= 1
-    
+        # Converged if all actionable agents agree (excluding HOLD)
+        if self._actions_agree(after):
+            return True
+
+        # Otherwise converged only when every position has stopped moving
+        for name, after_prop in after.items():
+            before_prop = before.get(name)
+            if before_prop is None:
+                return False
+            if after_prop.action != before_prop.action:
+                return False
+            if abs(after_prop.conviction - before_prop.conviction) > 0.05:
+                return False
+            if text_similarity(before_prop.thesis, after_prop.thesis) < 0.9:
+                return False
+        return True
+
+    @staticmethod
+    def _actions_agree(results: Dict[str, AgentProposal]) -> bool:
+        """True when at most one distinct non-HOLD action remains."""
+        return len({p.action for p in results.values() if p.action != "HOLD"}) <= 1
+
+    def _format_results_table(self, proposals: Dict[str, AgentProposal]) -> str:
+        """One pipe-delimited row per proposal.
+
+        The summary sits right above the full DETAILED ANALYSIS block, so a
+        terse table carries the same information as the indent=2 JSON it
+        replaces at a fraction of the tokens (thesis lives in the detail
+        block already).
+        """
+        return "\n".join(
+            f"{name}|{p.action}|{p.conviction:.2f}|evid={len(p.evidence)}"
+            for name, p in proposals.items()
+        )
+
     def _format_proposals_detail(self, proposals: Dict[str, AgentProposal]) -> str:
-        """Format proposals for LLM consumption."""
-        lines = []
+        """Format proposals for LLM consumption.
+
+        Built from plain fragments joined once, the same pattern the agents
+        use for peer summaries.
+        """
+        parts: List[str] = []
         for name, prop in proposals.items():
-            lines.append(f"\n{name.upper()} ANALYST:")
-            lines.append(f"  Action: {prop.action}")
-            lines.append(f"  Conviction: {prop.conviction:.2f}")
-            lines.append(f"  Thesis: {prop.thesis}")
-            if prop.evidence:
-                lines.append(f"  Evidence:")
-                for ev in prop.evidence[:5]:  # Limit to top 5
-                    lines.append(f"    - {ev}")
-        return "\n".join(lines)
+            parts.extend((
+                "\n", name.upper(), " ANALYST:",
+                "\n  Action: ", prop.action,
+                "\n  Conviction: ", f"{prop.conviction:.2f}",
+                "\n  Thesis: ", prop.thesis,
+                prop.evidence_block,  # pre-rendered top-5 lines, "" if empty
+            ))
+        return "".join(parts)
     
     def _parse_json_response(self, response: str) -> Dict[str, Any]:
         """Parse JSON from LLM response, handling code blocks."""
-        try:
-            # Try direct parse
-            return json.loads(response)
-        except json.JSONDecodeError:
-            # Try to find JSON in code blocks or text
-            start = response.find('{')
-            end = response.rfind('}')
-            if start != -1 and end != -1 and end > start:
-                json_str = response[start:end+1]
-                return json.loads(json_str)
-            
-            # Fallback: return empty dict
-            return {}
+        return _parse_json_str(response)
     
     def _log_step(self, step_name: str, data: Any):
-        """Log a step in the trajectory."""
+        """Log a step in the trajectory.
+
+        With a trajectory_log_path configured, each step is also appended to
+        the NDJSON log as it happens, so a crashed batch run keeps every
+        completed step instead of losing the whole in-memory trajectory.
+        """
         self.trajectory.add_step(step_name, data)
-    
+
+        if self._trajectory_log_path is not None:
+            if self._trajectory_log is None:
+                self._trajectory_log = open(self._trajectory_log_path, "a")
+            # One small buffered line per step - negligible next to the LLM
+            # round-trip that produced it. Timestamps render as ISO strings
+            # so the stream parses identically to Trajectory.flush output
+            # (the lazy in-memory step keeps its raw time_ns int).
+            step = self.trajectory.steps[-1]
+            if isinstance(step.get("timestamp"), int):
+                step = {**step, "timestamp": _isoformat_ns(step["timestamp"])}
+            self._trajectory_log.write(json_dumps(step) + "\n")
+            self._trajectory_log.flush()
+
     def save_trajectory(self, output_dir: Path):
         """Save complete trajectory to file for RL training."""
         self.trajectory.save(output_dir)
 
+    async def save_trajectory_async(self, output_dir: Path):
+        """Save the trajectory without blocking the event loop.
+
+        The full JSON dump can run to many MB in batch runs; writing it on a
+        worker thread keeps other in-flight analyses moving.
+        """
+        return await asyncio.to_thread(self.trajectory.save, output_dir)
+
+    async def flush_trajectory_async(self, filepath: Path) -> Path:
+        """Spill buffered trajectory steps to a JSONL file off-thread.
+
+        For backtest loops that drive this controller over many analyses:
+        call between analyses to keep the in-memory trajectory - and peak
+        RSS - from growing with the run length.
+        """
+        return await asyncio.to_thread(self.trajectory.flush, filepath)
+
+    async def aclose(self) -> None:
+        """Release resources held for the controller's lifetime.
+
+        Closes the LLM client's connection pool when the client exposes one
+        (the API client keeps warm TCP+TLS connections across the 5-10 calls
+        per analysis) and the incremental trajectory log, if open.
+        """
+        aclose = getattr(self.llm, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        self._io_executor.shutdown(wait=False)
+        if self._trajectory_log is not None:
+            self._trajectory_log.close()
+            self._trajectory_log = None
+
@@ -4,11 +4,23 @@ Loads data from CSV file for batch testing
 """
 
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 
+def _present(value) -> bool:
+    """True when a row-dict scalar is usable (not None and not NaN).
+
+    pd.notna on a scalar routes through pandas dispatch; the format_*
+    methods call it ~10 times per report, so a NaN!=NaN check is used
+    instead.
+    """
+    return value is not None and (not isinstance(value, float) or value == value)
+
+
 class CSVDataLoader:
     """Load and manage CSV trading data"""
     
@@ -27,9 +39,59 @@ class CSVDataLoader:
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
         
         self.csv_path = csv_path
-        self.data = pd.read_csv(csv_path)
+        # CSV parse dominates cold start. Prefer a parquet sibling (typed
+        # columns, no date re-parse, ~5-10x faster read); on first run fall
+        # back to the CSV and write the sibling for subsequent runs.
+        parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+        if os.path.exists(parquet_path):
+            try:
+                import pyarrow.parquet as pq
+                # Memory-map the file so load is a page-cache view shared
+                # across processes (parallel backtest workers) rather than
+                # a full heap copy; split_blocks/self_destruct let arrow
+                # hand buffers to pandas without duplicating them
+                table = pq.read_table(parquet_path, memory_map=True)
+                self.data = table.to_pandas(split_blocks=True, self_destruct=True)
+            except ImportError:
+                self.data = pd.read_parquet(parquet_path)
+        else:
+            self.data = pd.read_csv(
+                csv_path, parse_dates=['Date'], dtype={'symbol': 'category'}
+            )
+            try:
+                self.data.to_parquet(parquet_path, compression='zstd')
+            except (ImportError, OSError):
+                pass  # no pyarrow, or read-only data dir - CSV still works
+        # Categorical symbol regardless of source: a parquet written by an
+        # older version (or another tool) may carry plain strings, and the
+        # equality masks and groupbys below are int-compares on categories
+        if not isinstance(self.data['symbol'].dtype, pd.CategoricalDtype):
+            self.data['symbol'] = self.data['symbol'].astype('category')
         self.data['Date'] = pd.to_datetime(self.data['Date']).dt.date
         
+        # Group once up front: per-call boolean masks over the full frame
+        # made every lookup O(N), and get_test_cases O(N^2). Each per-symbol
+        # frame is pre-sorted by Date, with a date -> positional-index map
+        # for O(1) single-row lookup.
+        self.data.sort_values(['symbol', 'Date'], inplace=True)
+        self.data.reset_index(drop=True, inplace=True)
+        # Groups are kept as-is: after the sort each one is a contiguous
+        # block of self.data, and all lookups below are positional (iloc),
+        # so re-indexing would only force a copy of every group
+        self._by_symbol = {
+            sym: group for sym, group in self.data.groupby('symbol', sort=False)
+        }
+        # Dates as sorted int32 ordinals per symbol: _locate binary-searches
+        # a contiguous array instead of hashing date objects, and the N-entry
+        # dict of boxed keys goes away
+        self._dates_by_symbol = {
+            sym: np.fromiter(
+                (d.toordinal() for d in group['Date'].values),
+                dtype=np.int32, count=len(group)
+            )
+            for sym, group in self._by_symbol.items()
+        }
+        
         print(f"Loaded {len(self.data)} rows from {csv_path}")
         print(f"Symbols: {self.data['symbol'].unique().tolist()}")
         print(f"Date range: {self.data['Date'].min()} to {self.data['Date'].max()}")
@@ -40,47 +102,65 @@ class CSVDataLoader:
             return None
         return self.data.iloc[index].to_dict()
     
-    def get_data_for_date(self, symbol: str, date: str) -> Optional[Dict[str, Any]]:
-        """Get data for specific symbol and date"""
+    def _locate(self, symbol: str, date) -> Optional[int]:
+        """Positional index of (symbol, date) in the per-symbol frame, or None"""
         if isinstance(date, str):
             date = pd.to_datetime(date).date()
-        
-        mask = (self.data['symbol'] == symbol.upper()) & (self.data['Date'] == date)
-        result = self.data[mask]
-        
-        if len(result) == 0:
+        dates = self._dates_by_symbol.get(symbol.upper())
+        if dates is None:
+            return None
+        ordinal = date.toordinal()
+        idx = int(np.searchsorted(dates, ordinal))
+        if idx == len(dates) or dates[idx] != ordinal:
+            return None
+        return idx
+    
+    def get_data_for_date(self, symbol: str, date: str) -> Optional[Dict[str, Any]]:
+        """Get data for specific symbol and date"""
+        idx = self._locate(symbol, date)
+        if idx is None:
             return None
-        return result.iloc[0].to_dict()
+        return self._by_symbol[symbol.upper()].iloc[idx].to_dict()
     
     def get_next_day_data(self, symbol: str, date: str) -> Optional[Dict[str, Any]]:
         """Get next trading day's data"""
-        if isinstance(date, str):
-            date = pd.to_datetime(date).date()
-        
-        symbol_data = self.data[self.data['symbol'] == symbol.upper()].copy()
-        symbol_data = symbol_data.sort_values('Date')
-        
-        current_idx = symbol_data[symbol_data['Date'] == date].index
-        if len(current_idx) == 0:
+        idx = self._locate(symbol, date)
+        if idx is None:
             return None
         
-        current_position = symbol_data.index.get_loc(current_idx[0])
-        if current_position + 1 >= len(symbol_data):
+        symbol_data = self._by_symbol[symbol.upper()]
+        if idx + 1 >= len(symbol_data):
             return None
         
-        return symbol_data.iloc[current_position + 1].to_dict()
+        return symbol_data.iloc[idx + 1].to_dict()
     
     def get_historical_data(self, symbol: str, date: str, days_back: int = 30) -> pd.DataFrame:
         """Get historical data up to given date"""
         if isinstance(date, str):
             date = pd.to_datetime(date).date()
-        
-        symbol_data = self.data[self.data['symbol'] == symbol.upper()].copy()
-        symbol_data = symbol_data[symbol_data['Date'] <= date]
-        symbol_data = symbol_data.sort_values('Date', ascending=False).head(days_back)
-        
-        return symbol_data.sort_values('Date')
+
+        symbol_data = self._by_symbol.get(symbol.upper())
+        if symbol_data is None:
+            return pd.DataFrame(columns=self.data.columns)
+
+        # Rightmost row on or before the date (Date <= semantics), whether
+        # or not the date itself is a trading day for this symbol
+        dates = self._dates_by_symbol[symbol.upper()]
+        idx = int(np.searchsorted(dates, date.toordinal(), side='right')) - 1
+        if idx < 0:
+            return pd.DataFrame(columns=self.data.columns)
+
+        return symbol_data.iloc[max(0, idx - days_back + 1):idx + 1]
     
+    # The format_* reports are pure functions of (symbol, date) over the
+    # immutable loaded frame, and agents re-request the same pair many
+    # times within a trajectory - memoize them for the life of the loader.
+    # Never invalidated: the data never changes after load. This also makes
+    # eagerly pre-formatting numeric columns to strings at load a net loss:
+    # each row is formatted at most once on demand, while eager *_fmt
+    # columns would pay O(rows x columns) string work up front for rows
+    # most runs never render.
+    @lru_cache(maxsize=4096)
     def format_price_data(self, symbol: str, date: str) -> str:
         """Format price data for agent consumption"""
         hist = self.get_historical_data(symbol, date, days_back=30)
@@ -90,17 +170,28 @@ class CSVDataLoader:
         
         current = hist.iloc[-1]
         
-        output = f"Stock Price Data for {symbol} (as of {date}):\n\n"
-        output += f"Current Price: ${current['Close']:.2f}\n"
-        output += f"Day Range: ${current['Low']:.2f} - ${current['High']:.2f}\n"
-        output += f"Volume: {int(current['Volume']):,}\n\n"
-        
-        output += "Recent Price History (last 10 days):\n"
-        for _, row in hist.tail(10).iterrows():
-            output += f"  {row['Date']}: Open ${row['Open']:.2f}, Close ${row['Close']:.2f}, Volume {int(row['Volume']):,}\n"
-        
-        return output
+        parts = [f"Stock Price Data for {symbol} (as of {date}):\n\n"]
+        parts.append(f"Current Price: ${current['Close']:.2f}\n")
+        parts.append(f"Day Range: ${current['Low']:.2f} - ${current['High']:.2f}\n")
+        parts.append(f"Volume: {int(current['Volume']):,}\n\n")
+        
+        # Format the history block column-wise rather than via iterrows,
+        # which pays Python-level Series construction per row
+        tail = hist.tail(10)
+        dates = tail['Date'].astype(str).to_numpy()
+        opens = np.char.mod('$%.2f', tail['Open'].to_numpy(np.float64))
+        closes = np.char.mod('$%.2f', tail['Close'].to_numpy(np.float64))
+        volumes = [f"{int(v):,}" for v in tail['Volume'].to_numpy()]
+        
+        parts.append("Recent Price History (last 10 days):\n")
+        parts.extend(
+            [f"  {d}: Open {o}, Close {c}, Volume {v}\n"
+             for d, o, c, v in zip(dates, opens, closes, volumes)]
+        )
+        
+        return "".join(parts)
     
+    @lru_cache(maxsize=4096)
     def format_technical_indicators(self, symbol: str, date: str) -> str:
         """Format technical indicators for agent consumption"""
         current_data = self.get_data_for_date(symbol, date)
@@ -108,40 +199,41 @@ class CSVDataLoader:
         if current_data is None:
             return "No technical data available"
         
-        output = f"Technical Indicators for {symbol} (as of {date}):\n\n"
+        parts = [f"Technical Indicators for {symbol} (as of {date}):\n\n"]
         
         # Moving averages
-        if pd.notna(current_data.get('SMA_10')):
-            output += f"SMA(10): ${current_data['SMA_10']:.2f}\n"
-        if pd.notna(current_data.get('SMA_20')):
-            output += f"SMA(20): ${current_data['SMA_20']:.2f}\n"
-        if pd.notna(current_data.get('SMA_50')):
-            output += f"SMA(50): ${current_data['SMA_50']:.2f}\n"
+        if _present(current_data.get('SMA_10')):
+            parts.append(f"SMA(10): ${current_data['SMA_10']:.2f}\n")
+        if _present(current_data.get('SMA_20')):
+            parts.append(f"SMA(20): ${current_data['SMA_20']:.2f}\n")
+        if _present(current_data.get('SMA_50')):
+            parts.append(f"SMA(50): ${current_data['SMA_50']:.2f}\n")
         
         # MACD
-        if pd.notna(current_data.get('MACD')):
-            output += f"\nMACD: {current_data['MACD']:.4f}\n"
-            output += f"MACD Signal: {current_data['MACD_Signal']:.4f}\n"
-            output += f"MACD Histogram: {current_data['MACD_Hist']:.4f}\n"
+        if _present(current_data.get('MACD')):
+            parts.append(f"\nMACD: {current_data['MACD']:.4f}\n")
+            parts.append(f"MACD Signal: {current_data['MACD_Signal']:.4f}\n")
+            parts.append(f"MACD Histogram: {current_data['MACD_Hist']:.4f}\n")
         
         # RSI
-        if pd.notna(current_data.get('RSI')):
-            output += f"\nRSI: {current_data['RSI']:.2f}\n"
+        if _present(current_data.get('RSI')):
+            parts.append(f"\nRSI: {current_data['RSI']:.2f}\n")
             if current_data['RSI'] > 70:
-                output += "  (Overbought territory)\n"
+                parts.append("  (Overbought territory)\n")
             elif current_data['RSI'] < 30:
-                output += "  (Oversold territory)\n"
+                parts.append("  (Oversold territory)\n")
         
         # Bollinger Bands
-        if pd.notna(current_data.get('BB_Upper')):
-            output += f"\nBollinger Bands:\n"
-            output += f"  Upper: ${current_data['BB_Upper']:.2f}\n"
-            output += f"  Middle: ${current_data['BB_Middle']:.2f}\n"
-            output += f"  Lower: ${current_data['BB_Lower']:.2f}\n"
-            output += f"  Current Price: ${current_data['Close']:.2f}\n"
-        
-        return output
+        if _present(current_data.get('BB_Upper')):
+            parts.append("\nBollinger Bands:\n")
+            parts.append(f"  Upper: ${current_data['BB_Upper']:.2f}\n")
+            parts.append(f"  Middle: ${current_data['BB_Middle']:.2f}\n")
+            parts.append(f"  Lower: ${current_data['BB_Lower']:.2f}\n")
+            parts.append(f"  Current Price: ${current_data['Close']:.2f}\n")
+        
+        return "".join(parts)
     
+    @lru_cache(maxsize=4096)
     def format_fundamental_data(self, symbol: str, date: str) -> str:
         """Format fundamental data for agent consumption"""
         current_data = self.get_data_for_date(symbol, date)
@@ -149,25 +241,31 @@ class CSVDataLoader:
         if current_data is None:
             return "No fundamental data available"
         
-        output = f"Fundamental Data for {symbol} (as of {date}):\n\n"
+        parts = [f"Fundamental Data for {symbol} (as of {date}):\n\n"]
+        
+        pe_ratio = current_data.get('PE_Ratio')
+        market_cap = current_data.get('Market_Cap')
+        revenue = current_data.get('Revenue')
+        eps = current_data.get('EPS')
         
-        if pd.notna(current_data.get('PE_Ratio')):
-            output += f"P/E Ratio: {current_data['PE_Ratio']:.2f}\n"
+        if _present(pe_ratio):
+            parts.append(f"P/E Ratio: {pe_ratio:.2f}\n")
         
-        if pd.notna(current_data.get('Market_Cap')):
-            output += f"Market Cap: ${current_data['Market_Cap']:,.0f}\n"
+        if _present(market_cap):
+            parts.append(f"Market Cap: ${market_cap:,.0f}\n")
         
-        if pd.notna(current_data.get('Revenue')):
-            output += f"Revenue: ${current_data['Revenue']:,.0f}\n"
+        if _present(revenue):
+            parts.append(f"Revenue: ${revenue:,.0f}\n")
         
-        if pd.notna(current_data.get('EPS')):
-            output += f"EPS: ${current_data['EPS']:.2f}\n"
+        if _present(eps):
+            parts.append(f"EPS: ${eps:.2f}\n")
         
-        if not any(pd.notna(current_data.get(k)) for k in ['PE_Ratio', 'Market_Cap', 'Revenue', 'EPS']):
-            output += "Limited fundamental data available\n"
+        if not any(_present(v) for v in (pe_ratio, market_cap, revenue, eps)):
+            parts.append("Limited fundamental data available\n")
         
-        return output
+        return "".join(parts)
     
+    @lru_cache(maxsize=4096)
     def format_news_data(self, symbol: str, date: str) -> str:
         """Format news data for agent consumption"""
         current_data = self.get_data_for_date(symbol, date)
@@ -175,25 +273,25 @@ class CSVDataLoader:
         if current_data is None:
             return "No news data available"
         
-        output = f"News for {symbol} (as of {date}):\n\n"
+        parts = [f"News for {symbol} (as of {date}):\n\n"]
         
         # Check 'news' column first (from generate_offline_data_with_news.py)
-        if pd.notna(current_data.get('news')) and current_data['news']:
-            output += f"News: {current_data['news']}\n\n"
+        if _present(current_data.get('news')) and current_data['news']:
+            parts.append(f"News: {current_data['news']}\n\n")
         # Fallback to old format (title, source, sentiment)
-        elif pd.notna(current_data.get('title')) and current_data['title']:
-            output += f"Headline: {current_data['title']}\n"
-            if pd.notna(current_data.get('source')):
-                output += f"Source: {current_data['source']}\n"
-            if pd.notna(current_data.get('sentiment')):
-                output += f"Sentiment: {current_data['sentiment']}\n"
+        elif _present(current_data.get('title')) and current_data['title']:
+            parts.append(f"Headline: {current_data['title']}\n")
+            if _present(current_data.get('source')):
+                parts.append(f"Source: {current_data['source']}\n")
+            if _present(current_data.get('sentiment')):
+                parts.append(f"Sentiment: {current_data['sentiment']}\n")
         else:
-            output += "No significant news today\n"
+            parts.append("No significant news today\n")
         
-        if pd.notna(current_data.get('news_count')):
-            output += f"Total news articles: {int(current_data['news_count'])}\n"
+        if _present(current_data.get('news_count')):
+            parts.append(f"Total news articles: {int(current_data['news_count'])}\n")
         
-        return output
+        return "".join(parts)
     
     def calculate_actual_return(self, symbol: str, date: str) -> Optional[float]:
         """
@@ -202,14 +300,18 @@ class CSVDataLoader:
         Returns:
             Return percentage (e.g., 2.5 for 2.5% gain) or None if no next day data
         """
-        current = self.get_data_for_date(symbol, date)
-        next_day = self.get_next_day_data(symbol, date)
+        # Only the two closes are needed - read them positionally instead
+        # of materializing full row dicts via get_data_for_date
+        idx = self._locate(symbol, date)
+        if idx is None:
+            return None
         
-        if current is None or next_day is None:
+        closes = self._by_symbol[symbol.upper()]['Close']
+        if idx + 1 >= len(closes):
             return None
         
-        current_close = current['Close']
-        next_close = next_day['Close']
+        current_close = float(closes.iat[idx])
+        next_close = float(closes.iat[idx + 1])
         
         return ((next_close - current_close) / current_close) * 100
     
@@ -224,25 +326,31 @@ class CSVDataLoader:
         Returns:
             DataFrame of test cases with actual returns
         """
-        test_cases = []
-        
         data_to_process = self.data if symbol is None else self.data[self.data['symbol'] == symbol.upper()]
         
-        for idx, row in data_to_process.iterrows():
-            next_day = self.get_next_day_data(row['symbol'], row['Date'])
-            if next_day is not None:
-                actual_return = self.calculate_actual_return(row['symbol'], row['Date'])
-                test_cases.append({
-                    'index': idx,
-                    'symbol': row['symbol'],
-                    'date': row['Date'],
-                    'close': row['Close'],
-                    'next_close': next_day['Close'],
-                    'actual_return': actual_return,
-                    'actual_direction': 'UP' if actual_return > 0 else 'DOWN' if actual_return < 0 else 'FLAT'
-                })
-        
-        result = pd.DataFrame(test_cases)
+        # self.data is sorted by (symbol, Date), so a grouped shift(-1)
+        # pairs every row with its next trading day in one vectorized pass
+        # instead of an O(N) lookup per row. All symbols ride in the same
+        # pass, so fanning symbols out to worker processes would only add
+        # pickling and pool startup on top of work pandas already does at
+        # C speed.
+        next_close = data_to_process.groupby('symbol', sort=False)['Close'].shift(-1)
+        has_next = next_close.notna()
+        rows = data_to_process[has_next]
+        next_close = next_close[has_next]
+        actual_return = (next_close / rows['Close'] - 1) * 100
+        
+        result = pd.DataFrame({
+            'index': rows.index,
+            'symbol': rows['symbol'].values,
+            'date': rows['Date'].values,
+            'close': rows['Close'].values,
+            'next_close': next_close.values,
+            'actual_return': actual_return.values,
+            'actual_direction': np.where(
+                actual_return > 0, 'UP', np.where(actual_return < 0, 'DOWN', 'FLAT')
+            ),
+        })
         
         if max_cases is not None:
             result = result.head(max_cases)
@@ -250,16 +358,31 @@ class CSVDataLoader:
         return result
 
 
-# Global instance
-_csv_loader = None
+@lru_cache(maxsize=4)
+def _load_cached(csv_path: Optional[str]) -> CSVDataLoader:
+    return CSVDataLoader(csv_path)
+
+
+# Path of the most recent explicit-path call. Entry points prime the loader
+# with their --csv argument and the tool wrappers then call get_csv_loader()
+# bare, so bare calls must resolve to the primed dataset - not the default.
+_primed_csv_path: Optional[str] = None
 
 
 def get_csv_loader(csv_path: Optional[str] = None) -> CSVDataLoader:
-    """Get or create CSV loader instance"""
-    global _csv_loader
-    if _csv_loader is None:
-        _csv_loader = CSVDataLoader(csv_path)
-    return _csv_loader
+    """Get or create CSV loader instance
+
+    lru_cache keeps the lookup atomic under concurrent controllers - the
+    old check-then-assign global could construct (and load) the dataset
+    twice - and keys on the path, so tests pointing at different files
+    no longer share one loader. Calling with an explicit path also primes
+    the default: later bare calls return the same loader.
+    """
+    global _primed_csv_path
+    if csv_path is not None:
+        _primed_csv_path = csv_path
+        return _load_cached(csv_path)
+    return _load_cached(_primed_csv_path)
 
 
 def get_stock_price_data_csv(symbol: str, trade_date: str) -> str:
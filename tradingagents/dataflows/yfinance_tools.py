@@ -1,11 +1,168 @@
 """
 Fetch real market data using yfinance
 """
-from datetime import datetime, timedelta
+import asyncio
+import functools
+import inspect
+import json
+import os
+import time
+from datetime import date, datetime, timedelta
 from typing import Optional
+import numpy as np
 import yfinance as yf
 import pandas as pd
 
+from ..cache import CacheStore, make_cache_key
+from ..jsonutils import json_dumps, json_loads
+from ._ta_kernels import compute_indicators
+
+try:
+    import requests
+except ImportError:  # pragma: no cover - optional dependency guard
+    requests = None  # type: ignore[assignment]
+
+# One keep-alive session shared across tickers: without it every
+# Ticker.history call opens a fresh HTTPS connection (TCP + TLS handshake)
+_SESSION = requests.Session() if requests is not None else None
+
+
+@functools.lru_cache(maxsize=256)
+def _ticker(symbol: str) -> "yf.Ticker":
+    """yf.Ticker on the shared session, falling back if unsupported.
+
+    Memoized per symbol: agents query the same ticker several times in a
+    row (price, indicators, info, news) and Ticker construction is not
+    free.
+    """
+    if _SESSION is not None:
+        try:
+            return yf.Ticker(symbol, session=_SESSION)
+        except Exception:
+            pass
+    return yf.Ticker(symbol)
+
+
+# Histories warmed by prefetch(); _get_history serves slices from here
+# instead of making per-symbol HTTP calls
+_prefetched: dict = {}
+
+
+def prefetch(symbols, start, end) -> None:
+    """
+    Warm the history cache for a multi-symbol sweep with one download
+    
+    One threaded yf.download replaces the per-symbol HTTPS round trips
+    that get_stock_price_data / get_technical_indicators would otherwise
+    make; both check the prefetched frames first.
+    
+    Args:
+        symbols: Iterable of ticker symbols
+        start: Range start (datetime or YYYY-MM-DD string)
+        end: Range end, exclusive (datetime or YYYY-MM-DD string)
+    """
+    syms = sorted({s.upper() for s in symbols})
+    data = yf.download(
+        syms, start=start, end=end,
+        group_by='ticker', threads=True, auto_adjust=False, progress=False
+    )
+    for sym in syms:
+        # Branch on the column structure, not the list length: recent
+        # yfinance returns ticker-level MultiIndex columns even for a
+        # one-ticker download
+        hist = data[sym] if isinstance(data.columns, pd.MultiIndex) else data
+        _prefetched[sym] = hist.dropna(subset=['Close'])
+
+
+@functools.lru_cache(maxsize=512)
+def _history_cached(symbol: str, start_date: datetime, end_date: datetime,
+                    bucket: int) -> pd.DataFrame:
+    # bucket changes hourly, so entries invalidate themselves without a
+    # TTL sweep (the report-level cache above handles longer horizons)
+    return _ticker(symbol).history(start=start_date, end=end_date)
+
+
+def _get_history(symbol: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    """History for [start_date, end_date), from the prefetch cache or live.
+
+    get_stock_price_data and get_technical_indicators request the exact
+    same window back to back; memoizing the live fetch halves their HTTP
+    calls. Returns a copy - callers add columns to the frame.
+    """
+    pre = _prefetched.get(symbol)
+    if pre is not None:
+        mask = (pre.index.date >= start_date.date()) & (pre.index.date < end_date.date())
+        return pre[mask]
+    bucket = int(time.time() // 3600)
+    return _history_cached(symbol, start_date, end_date, bucket).copy()
+
+# Reports are re-requested for the same (symbol, trade_date) many times in
+# a trajectory and across backtest reruns; each miss is a yfinance HTTP
+# round trip. Repeat requests are served from an in-process TTL memo, and
+# optionally from disk across processes when DATA_CACHE_PATH is set
+# (mirroring PROPOSAL_CACHE_PATH / LLM_CACHE_PATH).
+_DATA_CACHE_PATH = os.environ.get("DATA_CACHE_PATH")
+_disk_cache: Optional[CacheStore] = None
+_mem_cache: dict = {}  # key -> (expires_at, report)
+
+
+def _get_disk_cache() -> Optional[CacheStore]:
+    global _disk_cache
+    if _disk_cache is None and _DATA_CACHE_PATH:
+        _disk_cache = CacheStore(_DATA_CACHE_PATH)
+    return _disk_cache
+
+
+def _report_cache(ttl: float, live_ttl: Optional[float] = None):
+    """Memoize a report builder on its call arguments for ttl seconds.
+
+    A report pinned to an explicit trade_date describes immutable history
+    and keeps the full ttl; a call without one describes "now" and uses
+    the shorter live_ttl when given. Error/empty reports are not cached so
+    transient fetch failures retry. Wall-clock expiry (time.time) so disk
+    entries age across processes.
+    """
+    def decorate(fn):
+        # Pinned means the bound trade_date value is set - counting
+        # positional args misreads fn(sym, days, None) as pinned
+        params = tuple(inspect.signature(fn).parameters)
+        trade_idx = params.index("trade_date") if "trade_date" in params else None
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            trade_date = kwargs.get("trade_date")
+            if trade_date is None and trade_idx is not None and len(args) > trade_idx:
+                trade_date = args[trade_idx]
+            pinned = trade_date is not None
+            entry_ttl = ttl if pinned or live_ttl is None else live_ttl
+            key = make_cache_key(fn=fn.__name__, args=args, kwargs=kwargs)
+            now = time.time()
+
+            entry = _mem_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            disk = _get_disk_cache()
+            if disk is not None:
+                raw = disk.get(key)
+                if raw is not None:
+                    stored = json_loads(raw)
+                    if stored["expires_at"] > now:
+                        _mem_cache[key] = (stored["expires_at"], stored["report"])
+                        return stored["report"]
+
+            report = fn(*args, **kwargs)
+            if not report.startswith(("Error", "Unable", "No ")):
+                _mem_cache[key] = (now + entry_ttl, report)
+                if disk is not None:
+                    disk.put(key, json_dumps(
+                        {"expires_at": now + entry_ttl, "report": report}
+                    ).encode())
+            return report
+
+        return wrapper
+    return decorate
+
 
 def _parse_trade_date(trade_date: str) -> datetime:
     """
@@ -39,6 +196,26 @@ def _parse_trade_date(trade_date: str) -> datetime:
     raise ValueError(f"Invalid date format: {trade_date}. Expected YYYY-MM-DD or YYYY-M-D")
 
 
+def _resolve_dates(trade_date: Optional[str]):
+    """Target date and exclusive yfinance end date for a trade_date string.
+
+    Falls back to the current date when trade_date is missing or unparsable.
+    """
+    if trade_date:
+        try:
+            target_date = _parse_trade_date(trade_date)
+        except ValueError:
+            # If date parsing fails, fall back to current date
+            target_date = datetime.now()
+    else:
+        target_date = datetime.now()
+    # yfinance's end is exclusive; pad it by a few days so a target that
+    # falls on a weekend/holiday still lands in a single fetch (callers
+    # filter back down to rows on or before the target date)
+    return target_date, target_date + timedelta(days=6)
+
+
+@_report_cache(ttl=86400.0, live_ttl=6 * 3600.0)
 def get_stock_price_data(
     symbol: str,
     days_back: int = 90,
@@ -56,23 +233,13 @@ def get_stock_price_data(
         Formatted price data string
     """
     try:
-        if trade_date:
-            try:
-                target_date = _parse_trade_date(trade_date)
-                # yfinance's end parameter is exclusive, so we need end_date = target_date + 1 day
-                end_date = target_date + timedelta(days=1)
-            except ValueError:
-                # If date parsing fails, fall back to current date
-                target_date = datetime.now()
-                end_date = target_date + timedelta(days=1)
-        else:
-            target_date = datetime.now()
-            end_date = target_date + timedelta(days=1)
+        target_date, end_date = _resolve_dates(trade_date)
         
-        start_date = end_date - timedelta(days=days_back + 5)  # Extra buffer to ensure we get enough data
+        # Extra buffer to ensure we get enough data; anchored to the target
+        # (not the padded end) so the lookback window stays put
+        start_date = target_date - timedelta(days=days_back + 4)
         
-        ticker = yf.Ticker(symbol.upper())
-        data = ticker.history(start=start_date, end=end_date)
+        data = _get_history(symbol.upper(), start_date, end_date)
         
         # Filter data to only include dates up to and including the target_date (if specified)
         if trade_date:
@@ -80,18 +247,38 @@ def get_stock_price_data(
             target_date_only = target_date.date()
             # Filter data to only include rows up to target_date
             data = data[data.index.date <= target_date_only]
-            # If no data found on exact date, try to find the most recent trading day before target_date
-            if data.empty:
-                # Try getting data up to target_date + a few days to find the last trading day
-                extended_end = target_date + timedelta(days=5)
-                extended_data = ticker.history(start=start_date, end=extended_end)
-                extended_data = extended_data[extended_data.index.date <= target_date_only]
-                if not extended_data.empty:
-                    data = extended_data
         
         if data.empty:
             return f"Unable to fetch data for {symbol} for date {trade_date if trade_date else 'current date'}, possibly invalid ticker symbol or non-trading day."
-        
+
+        return _build_price_report(symbol.upper(), data, target_date, trade_date)
+
+    except Exception as e:
+        return f"Error fetching data for {symbol}: {str(e)}"
+
+
+def _build_price_report(
+    symbol: str,
+    data: pd.DataFrame,
+    target_date: datetime,
+    trade_date: Optional[str]
+) -> str:
+    """
+    Render the price report for an already-fetched OHLCV frame
+
+    Shared by get_stock_price_data (single fetch) and batch_price_data
+    (one download sliced per symbol).
+
+    Args:
+        symbol: Upper-cased ticker symbol
+        data: Non-empty OHLCV frame already filtered to the target date
+        target_date: Resolved analysis date
+        trade_date: Original trade date string (None for live calls)
+
+    Returns:
+        Formatted price data string
+    """
+    try:
         # Remove timezone info
         if data.index.tz is not None:
             data.index = data.index.tz_localize(None)
@@ -111,12 +298,14 @@ def get_stock_price_data(
         recent_volume = data['Volume'].iloc[-1]
         volume_ratio = (recent_volume / avg_volume) * 100 if avg_volume > 0 else 0
         
-        # Calculate simple technical indicators
-        data['SMA_20'] = data['Close'].rolling(window=20).mean()
-        data['SMA_50'] = data['Close'].rolling(window=50).mean()
-        
-        sma_20 = data['SMA_20'].iloc[-1]
-        sma_50 = data['SMA_50'].iloc[-1] if len(data) >= 50 else None
+        # Only the last SMA values appear in the report, so take them
+        # straight off the close array instead of materializing two full
+        # rolling Series (the indicator report computes its own series via
+        # the shared kernel, on the same _get_history frame - no second
+        # download and no duplicated rolling passes)
+        close = data['Close'].to_numpy(np.float64)
+        sma_20 = close[-20:].mean() if len(close) >= 20 else float('nan')
+        sma_50 = close[-50:].mean() if len(close) >= 50 else None
         
         # Format SMA50 value
         sma_50_str = f"${sma_50:.2f}" if sma_50 is not None and pd.notna(sma_50) else "N/A"
@@ -133,7 +322,7 @@ def get_stock_price_data(
             date_note = f"\nNote: {trade_date} was not a trading day. Using most recent trading day: {actual_last_trading_date}"
         
         report = f"""
-=== {symbol.upper()} Price Data ===
+=== {symbol} Price Data ===
 Analysis Date: {target_date.strftime('%Y-%m-%d')}{date_note}
 Data Range: {data.index[0].strftime('%Y-%m-%d') if not data.empty else 'N/A'} to {actual_end_date}
 
@@ -156,16 +345,25 @@ Technical Indicators:
 
 Last 10 Trading Days:
 """
-        # Add last 10 days data table
-        recent_data = data.tail(10)[['Open', 'High', 'Low', 'Close', 'Volume']]
-        report += recent_data.to_string()
-        
+        # Add last 10 days data table. Hand-rolled rows over the raw numpy
+        # values: DataFrame.to_string dispatches a per-cell repr and costs
+        # more than the rest of the report combined
+        arr = data.to_numpy()[-10:]
+        dates = data.index[-10:].strftime('%Y-%m-%d')
+        rows = [f"{'Date':<12}{'Open':>9}{'High':>9}{'Low':>9}{'Close':>9}{'Volume':>14}"]
+        rows.extend(
+            f"{d:<12}{o:>9.2f}{h:>9.2f}{l:>9.2f}{c:>9.2f}{v:>14,.0f}"
+            for d, (o, h, l, c, v) in zip(dates, arr)
+        )
+        report += "\n".join(rows)
+
         return report
         
     except Exception as e:
         return f"Error fetching data for {symbol}: {str(e)}"
 
 
+@_report_cache(ttl=86400.0, live_ttl=6 * 3600.0)
 def get_technical_indicators(
     symbol: str,
     days_back: int = 90,
@@ -183,23 +381,13 @@ def get_technical_indicators(
         Technical indicators analysis string
     """
     try:
-        if trade_date:
-            try:
-                target_date = _parse_trade_date(trade_date)
-                # yfinance's end parameter is exclusive, so we need end_date = target_date + 1 day
-                end_date = target_date + timedelta(days=1)
-            except ValueError:
-                # If date parsing fails, fall back to current date
-                target_date = datetime.now()
-                end_date = target_date + timedelta(days=1)
-        else:
-            target_date = datetime.now()
-            end_date = target_date + timedelta(days=1)
+        target_date, end_date = _resolve_dates(trade_date)
         
-        start_date = end_date - timedelta(days=days_back + 5)  # Extra buffer to ensure we get enough data
+        # Extra buffer to ensure we get enough data; anchored to the target
+        # (not the padded end) so the lookback window stays put
+        start_date = target_date - timedelta(days=days_back + 4)
         
-        ticker = yf.Ticker(symbol.upper())
-        data = ticker.history(start=start_date, end=end_date)
+        data = _get_history(symbol.upper(), start_date, end_date)
         
         # Filter data to only include dates up to and including the target_date (if specified)
         if trade_date:
@@ -207,96 +395,90 @@ def get_technical_indicators(
             target_date_only = target_date.date()
             # Filter data to only include rows up to target_date
             data = data[data.index.date <= target_date_only]
-            # If no data found on exact date, try to find the most recent trading day before target_date
-            if data.empty:
-                # Try getting data up to target_date + a few days to find the last trading day
-                extended_end = target_date + timedelta(days=5)
-                extended_data = ticker.history(start=start_date, end=extended_end)
-                extended_data = extended_data[extended_data.index.date <= target_date_only]
-                if not extended_data.empty:
-                    data = extended_data
         
         if data.empty:
             return f"Unable to fetch data for {symbol} for date {trade_date if trade_date else 'current date'}."
         
-        # Calculate moving averages
-        data['SMA_10'] = data['Close'].rolling(window=10).mean()
-        data['SMA_20'] = data['Close'].rolling(window=20).mean()
-        data['SMA_50'] = data['Close'].rolling(window=50).mean()
-        
-        # Calculate RSI
-        delta = data['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        data['RSI'] = 100 - (100 / (1 + rs))
-        
-        # Calculate MACD
-        exp1 = data['Close'].ewm(span=12, adjust=False).mean()
-        exp2 = data['Close'].ewm(span=26, adjust=False).mean()
-        data['MACD'] = exp1 - exp2
-        data['Signal'] = data['MACD'].ewm(span=9, adjust=False).mean()
-        data['MACD_Hist'] = data['MACD'] - data['Signal']
-        
-        # Calculate Bollinger Bands
-        data['BB_Middle'] = data['Close'].rolling(window=20).mean()
-        bb_std = data['Close'].rolling(window=20).std()
-        data['BB_Upper'] = data['BB_Middle'] + (bb_std * 2)
-        data['BB_Lower'] = data['BB_Middle'] - (bb_std * 2)
-        
-        # Get latest values
-        latest = data.iloc[-1]
-        current_price = latest['Close']
+        return _build_technical_report(symbol, data)
+        
+    except Exception as e:
+        return f"Error calculating technical indicators for {symbol}: {str(e)}"
+
+
+def _build_technical_report(symbol: str, data: pd.DataFrame) -> str:
+    """Render the technical-indicator report for an OHLCV history frame.
+
+    Reads the frame, never writes it: only the latest values appear in
+    the report, so they come straight off the kernel outputs instead of
+    being written back as ten columns and re-read through a boxed row.
+    """
+    try:
+        # All indicators in a single pass over the close array (see
+        # _ta_kernels) instead of a dozen pandas rolling/ewm Series
+        close = data['Close'].to_numpy(np.float64)
+        (sma_10, sma_20, sma_50, rsi, macd, signal, macd_hist,
+         bb_upper, bb_middle, bb_lower) = compute_indicators(close)
+        
+        current_price = close[-1]
+        sma_10_last = sma_10[-1]
+        sma_20_last = sma_20[-1]
+        sma_50_last = sma_50[-1]
+        rsi_last = rsi[-1]
+        macd_last = macd[-1]
+        signal_last = signal[-1]
+        macd_hist_last = macd_hist[-1]
+        bb_upper_last = bb_upper[-1]
+        bb_middle_last = bb_middle[-1]
+        bb_lower_last = bb_lower[-1]
         
         # Format SMA50 value
-        sma_50_value = latest['SMA_50']
-        if pd.notna(sma_50_value):
-            sma_50_str = f"${sma_50_value:.2f}"
-            sma_50_position = "above" if current_price > sma_50_value else "below"
+        if sma_50_last == sma_50_last:
+            sma_50_str = f"${sma_50_last:.2f}"
+            sma_50_position = "above" if current_price > sma_50_last else "below"
         else:
             sma_50_str = "N/A"
             sma_50_position = "N/A"
         
         # Determine positions
-        sma_10_pos = "above" if current_price > latest['SMA_10'] else "below"
-        sma_20_pos = "above" if current_price > latest['SMA_20'] else "below"
+        sma_10_pos = "above" if current_price > sma_10_last else "below"
+        sma_20_pos = "above" if current_price > sma_20_last else "below"
         
         # RSI status
-        if latest['RSI'] > 70:
+        if rsi_last > 70:
             rsi_status = "Overbought (>70)"
-        elif latest['RSI'] < 30:
+        elif rsi_last < 30:
             rsi_status = "Oversold (<30)"
         else:
             rsi_status = "Neutral"
         
         # MACD status
-        macd_hist_status = "bullish" if latest['MACD_Hist'] > 0 else "bearish"
-        macd_trend = "MACD above signal (bullish)" if latest['MACD'] > latest['Signal'] else "MACD below signal (bearish)"
+        macd_hist_status = "bullish" if macd_hist_last > 0 else "bearish"
+        macd_trend = "MACD above signal (bullish)" if macd_last > signal_last else "MACD below signal (bearish)"
         
         # Build report
         report = f"""
 === {symbol.upper()} Technical Indicators ===
 
 Moving Averages:
-  - SMA10: ${latest['SMA_10']:.2f} ({sma_10_pos})
-  - SMA20: ${latest['SMA_20']:.2f} ({sma_20_pos})
+  - SMA10: ${sma_10_last:.2f} ({sma_10_pos})
+  - SMA20: ${sma_20_last:.2f} ({sma_20_pos})
   - SMA50: {sma_50_str} ({sma_50_position})
 
 RSI (Relative Strength Index):
-  - Current: {latest['RSI']:.2f}
+  - Current: {rsi_last:.2f}
   - Status: {rsi_status}
 
 MACD:
-  - MACD line: {latest['MACD']:.2f}
-  - Signal line: {latest['Signal']:.2f}
-  - Histogram: {latest['MACD_Hist']:.2f} ({macd_hist_status})
+  - MACD line: {macd_last:.2f}
+  - Signal line: {signal_last:.2f}
+  - Histogram: {macd_hist_last:.2f} ({macd_hist_status})
   - Trend: {macd_trend}
 
 Bollinger Bands:
-  - Upper: ${latest['BB_Upper']:.2f}
-  - Middle: ${latest['BB_Middle']:.2f}
-  - Lower: ${latest['BB_Lower']:.2f}
-  - Position: {((current_price - latest['BB_Lower']) / (latest['BB_Upper'] - latest['BB_Lower']) * 100):.1f}% (0%=lower, 100%=upper)
+  - Upper: ${bb_upper_last:.2f}
+  - Middle: ${bb_middle_last:.2f}
+  - Lower: ${bb_lower_last:.2f}
+  - Position: {((current_price - bb_lower_last) / (bb_upper_last - bb_lower_last) * 100):.1f}% (0%=lower, 100%=upper)
 
 Trading Signals:
 """
@@ -304,21 +486,21 @@ Trading Signals:
         signals = []
         
         # Moving average signals
-        if current_price > latest['SMA_10'] > latest['SMA_20']:
+        if current_price > sma_10_last > sma_20_last:
             signals.append("✓ Short-term MAs aligned bullish")
-        elif current_price < latest['SMA_10'] < latest['SMA_20']:
+        elif current_price < sma_10_last < sma_20_last:
             signals.append("✗ Short-term MAs aligned bearish")
         
         # RSI signals
-        if latest['RSI'] > 70:
+        if rsi_last > 70:
             signals.append("⚠ RSI overbought, possible pullback")
-        elif latest['RSI'] < 30:
+        elif rsi_last < 30:
             signals.append("✓ RSI oversold, possible bounce")
         
         # MACD signals
-        if latest['MACD'] > latest['Signal'] and latest['MACD_Hist'] > 0:
+        if macd_last > signal_last and macd_hist_last > 0:
             signals.append("✓ MACD bullish crossover")
-        elif latest['MACD'] < latest['Signal'] and latest['MACD_Hist'] < 0:
+        elif macd_last < signal_last and macd_hist_last < 0:
             signals.append("✗ MACD bearish crossover")
         
         report += "\n".join(f"  {s}" for s in signals) if signals else "  - No clear signals"
@@ -329,23 +511,203 @@ Trading Signals:
         return f"Error calculating technical indicators for {symbol}: {str(e)}"
 
 
+_BATCH_CACHE_MAX = 64
+
+
+def _batch_cache_get(cache: dict, key: tuple) -> Optional[dict]:
+    """Return live cached batch reports for key, dropping expired entries."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    expires_at, reports = entry
+    if time.time() >= expires_at:
+        del cache[key]
+        return None
+    return reports
+
+
+def _batch_cache_put(cache: dict, key: tuple, reports: dict) -> None:
+    """Store batch reports under the same TTL discipline as _report_cache.
+
+    24h when pinned to a trade_date (key[1]), 6h for live calls, and the
+    dict is bounded so a long-lived sweep cannot grow it without limit.
+    """
+    if len(cache) >= _BATCH_CACHE_MAX:
+        cache.pop(next(iter(cache)))
+    entry_ttl = 86400.0 if key[1] else 6 * 3600.0
+    cache[key] = (time.time() + entry_ttl, reports)
+
+
+_batch_indicator_cache: dict = {}  # (symbols, trade_date, days_back) -> (expires_at, reports)
+
+
+def batch_technical_indicators(
+    symbols,
+    days_back: int = 90,
+    trade_date: Optional[str] = None
+) -> dict:
+    """
+    Calculate technical indicators for many tickers from one download
+    
+    Sweeping symbols through get_technical_indicators pays one HTTPS
+    round trip each; yf.download fetches the whole batch in a single
+    threaded call and each report is then rendered from its slice.
+    
+    Args:
+        symbols: Iterable of ticker symbols
+        days_back: Number of days of historical data
+        trade_date: Specific date to analyze (YYYY-MM-DD format), None means use current date
+    
+    Returns:
+        Dict mapping upper-cased symbol to its indicator report string
+    """
+    syms = tuple(sorted({s.upper() for s in symbols}))
+    cache_key = (syms, trade_date, days_back)
+    cached = _batch_cache_get(_batch_indicator_cache, cache_key)
+    if cached is not None:
+        return cached
+    
+    target_date, end_date = _resolve_dates(trade_date)
+    # Extra buffer to ensure we get enough data; anchored to the target
+    # (not the padded end) so the lookback window stays put
+    start_date = target_date - timedelta(days=days_back + 4)
+    
+    try:
+        data = yf.download(
+            list(syms), start=start_date, end=end_date,
+            group_by='ticker', threads=True, auto_adjust=False, progress=False
+        )
+    except Exception as e:
+        return {sym: f"Error calculating technical indicators for {sym}: {str(e)}" for sym in syms}
+    
+    reports = {}
+    for sym in syms:
+        try:
+            # Slice by column structure - recent yfinance returns
+            # MultiIndex columns even for a one-ticker download
+            hist = data[sym] if isinstance(data.columns, pd.MultiIndex) else data
+            hist = hist.dropna(subset=['Close'])
+            if trade_date:
+                hist = hist[hist.index.date <= target_date.date()]
+            if hist.empty:
+                reports[sym] = f"Unable to fetch data for {sym} for date {trade_date if trade_date else 'current date'}."
+            else:
+                reports[sym] = _build_technical_report(sym, hist)
+        except Exception as e:
+            reports[sym] = f"Error calculating technical indicators for {sym}: {str(e)}"
+    
+    _batch_cache_put(_batch_indicator_cache, cache_key, reports)
+    return reports
+
+
+_batch_price_cache: dict = {}  # (symbols, trade_date, days_back) -> (expires_at, reports)
+
+
+def batch_price_data(
+    symbols,
+    days_back: int = 90,
+    trade_date: Optional[str] = None
+) -> dict:
+    """
+    Fetch price reports for many tickers from one download
+
+    Same bulk path as batch_technical_indicators: one threaded
+    yf.download for the whole universe instead of one HTTPS round trip
+    per symbol, with each report rendered from its slice.
+
+    Args:
+        symbols: Iterable of ticker symbols
+        days_back: Number of days of historical data
+        trade_date: Specific date to analyze (YYYY-MM-DD format), None means use current date
+
+    Returns:
+        Dict mapping upper-cased symbol to its price report string
+    """
+    syms = tuple(sorted({s.upper() for s in symbols}))
+    cache_key = (syms, trade_date, days_back)
+    cached = _batch_cache_get(_batch_price_cache, cache_key)
+    if cached is not None:
+        return cached
+
+    target_date, end_date = _resolve_dates(trade_date)
+    # Extra buffer to ensure we get enough data; anchored to the target
+    # (not the padded end) so the lookback window stays put
+    start_date = target_date - timedelta(days=days_back + 4)
+
+    try:
+        data = yf.download(
+            list(syms), start=start_date, end=end_date,
+            group_by='ticker', threads=True, auto_adjust=False, progress=False
+        )
+    except Exception as e:
+        return {sym: f"Error fetching data for {sym}: {str(e)}" for sym in syms}
+
+    reports = {}
+    for sym in syms:
+        try:
+            # Slice by column structure - recent yfinance returns
+            # MultiIndex columns even for a one-ticker download
+            hist = data[sym] if isinstance(data.columns, pd.MultiIndex) else data
+            hist = hist.dropna(subset=['Close'])
+            if trade_date:
+                hist = hist[hist.index.date <= target_date.date()]
+            if hist.empty:
+                reports[sym] = f"Unable to fetch data for {sym} for date {trade_date if trade_date else 'current date'}, possibly invalid ticker symbol or non-trading day."
+            else:
+                reports[sym] = _build_price_report(sym, hist, target_date, trade_date)
+        except Exception as e:
+            reports[sym] = f"Error fetching data for {sym}: {str(e)}"
+
+    _batch_cache_put(_batch_price_cache, cache_key, reports)
+    return reports
+
+
+@functools.lru_cache(maxsize=256)
+def _company_info(symbol: str, day: date) -> dict:
+    """Heavy quote-summary blob, keyed by day
+
+    Fundamentals change at most daily, so keying the fetch on
+    (symbol, today) guarantees at most one full quote-summary request
+    per symbol per day even when the report cache misses. An empty
+    result raises instead of returning - lru_cache does not memoize
+    exceptions, so a failed fetch retries on the next call rather than
+    being pinned for the rest of the day.
+    """
+    info = _ticker(symbol).info
+    if not info:
+        raise LookupError(f"no company info returned for {symbol}")
+    return info
+
+
+@_report_cache(ttl=7 * 86400.0)
 def get_company_info(symbol: str) -> str:
     """
     Get company basic information
-    
+
     Args:
         symbol: Stock ticker symbol
-    
+
     Returns:
         Company information string
     """
     try:
-        ticker = yf.Ticker(symbol.upper())
-        info = ticker.info
-        
-        if not info or 'symbol' not in info:
+        ticker = _ticker(symbol.upper())
+        try:
+            info = _company_info(symbol.upper(), date.today())
+        except LookupError:
             return f"Unable to fetch company info for {symbol}."
-        
+
+        if 'symbol' not in info:
+            return f"Unable to fetch company info for {symbol}."
+
+        # fast_info serves market cap from the lightweight quote endpoint
+        # (~10x cheaper than the full blob and less rate-limited); fall
+        # back to the cached blob if it is unavailable
+        try:
+            market_cap = ticker.fast_info['marketCap'] or info.get('marketCap', 0)
+        except Exception:
+            market_cap = info.get('marketCap', 0)
+
         report = f"""
 === {symbol.upper()} Company Information ===
 
@@ -356,7 +718,7 @@ Basic Info:
   - Country: {info.get('country', 'N/A')}
 
 Valuation Metrics:
-  - Market Cap: ${info.get('marketCap', 0) / 1e9:.2f}B
+  - Market Cap: ${market_cap / 1e9:.2f}B
   - P/E Ratio: {info.get('trailingPE', 'N/A')}
   - P/B Ratio: {info.get('priceToBook', 'N/A')}
   - Dividend Yield: {info.get('dividendYield', 0) * 100:.2f}% (if any)
@@ -377,6 +739,7 @@ Analyst Targets:
         return f"Error fetching company info for {symbol}: {str(e)}"
 
 
+@_report_cache(ttl=1800.0)
 def get_recent_news(symbol: str, max_news: int = 5) -> str:
     """
     Get recent news
@@ -389,13 +752,13 @@ def get_recent_news(symbol: str, max_news: int = 5) -> str:
         News summary string
     """
     try:
-        ticker = yf.Ticker(symbol.upper())
+        ticker = _ticker(symbol.upper())
         news = ticker.news
         
         if not news or len(news) == 0:
             return f"No recent news found for {symbol}."
         
-        report = f"=== {symbol.upper()} Recent News ===\n\n"
+        parts = [f"=== {symbol.upper()} Recent News ===\n\n"]
         
         valid_news_count = 0
         for item in news:
@@ -411,8 +774,8 @@ def get_recent_news(symbol: str, max_news: int = 5) -> str:
             timestamp = datetime.fromtimestamp(timestamp_raw)
             
             valid_news_count += 1
-            report += f"{valid_news_count}. {title}\n"
-            report += f"   Source: {publisher if publisher else 'Unknown'} | Time: {timestamp.strftime('%Y-%m-%d %H:%M')}\n\n"
+            parts.append(f"{valid_news_count}. {title}\n")
+            parts.append(f"   Source: {publisher if publisher else 'Unknown'} | Time: {timestamp.strftime('%Y-%m-%d %H:%M')}\n\n")
             
             if valid_news_count >= max_news:
                 break
@@ -420,8 +783,72 @@ def get_recent_news(symbol: str, max_news: int = 5) -> str:
         if valid_news_count == 0:
             return f"No valid recent news found for {symbol}."
         
-        return report
+        return "".join(parts)
         
     except Exception as e:
         return f"Error fetching news for {symbol}: {str(e)}"
 
+
+# Async wrappers: the fetchers above are blocking HTTP calls, so when an
+# agent needs several reports they serialize. Each wrapper pushes the call
+# onto a worker thread (same pattern the controller uses for tool fetches),
+# letting callers gather them concurrently.
+
+async def aget_stock_price_data(
+    symbol: str,
+    days_back: int = 90,
+    trade_date: Optional[str] = None
+) -> str:
+    """Async wrapper for get_stock_price_data."""
+    return await asyncio.to_thread(get_stock_price_data, symbol, days_back, trade_date)
+
+
+async def aget_technical_indicators(
+    symbol: str,
+    days_back: int = 90,
+    trade_date: Optional[str] = None
+) -> str:
+    """Async wrapper for get_technical_indicators."""
+    return await asyncio.to_thread(get_technical_indicators, symbol, days_back, trade_date)
+
+
+async def aget_company_info(symbol: str) -> str:
+    """Async wrapper for get_company_info."""
+    return await asyncio.to_thread(get_company_info, symbol)
+
+
+async def aget_recent_news(symbol: str, max_news: int = 5) -> str:
+    """Async wrapper for get_recent_news."""
+    return await asyncio.to_thread(get_recent_news, symbol, max_news)
+
+
+async def gather_symbol_bundle(
+    symbol: str,
+    days_back: int = 90,
+    trade_date: Optional[str] = None
+) -> dict:
+    """
+    Fetch all four reports for one symbol concurrently
+
+    Args:
+        symbol: Stock ticker symbol
+        days_back: Number of days of historical data
+        trade_date: Specific date to analyze (YYYY-MM-DD format), None means use current date
+
+    Returns:
+        Dict with 'price_data', 'technical_indicators', 'company_info'
+        and 'recent_news' report strings
+    """
+    price, indicators, info, news = await asyncio.gather(
+        aget_stock_price_data(symbol, days_back, trade_date),
+        aget_technical_indicators(symbol, days_back, trade_date),
+        aget_company_info(symbol),
+        aget_recent_news(symbol),
+    )
+    return {
+        'price_data': price,
+        'technical_indicators': indicators,
+        'company_info': info,
+        'recent_news': news,
+    }
+
@@ -0,0 +1,84 @@
+"""
+Shared JSON Helpers for LLM Responses
+
+LLM output wraps its JSON in prose or code fences more often than not.
+These helpers extract and parse it with a single forward scan instead of
+find/rfind passes, and use orjson's C parser and encoder when installed
+(stdlib json as the fallback - both raise ValueError subclasses on
+malformed input).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency guard
+    orjson = None  # type: ignore[assignment]
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumps(obj, pretty: bool = False) -> str:
+    """Serialize obj to a JSON string, preferring orjson's C encoder."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if pretty else None)
+
+
+def json_dumps_sorted(obj) -> bytes:
+    """Deterministic compact encoding (sorted keys, str() for unknown types).
+
+    Used for hashing request/cache keys, so key order must not matter and
+    any stray non-JSON value degrades to its repr instead of raising.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+    return json.dumps(obj, sort_keys=True, default=str).encode()
+
+
+def find_balanced_json(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} span in text, or None.
+
+    Single forward pass tracking brace depth and string state, so prose or
+    code fences around the JSON (or stray braces inside strings) don't throw
+    off the extraction the way find('{')/rfind('}') could.
+    """
+    first_brace = text.find('{')
+    if first_brace == -1:
+        return None
+    # Skip any prose preamble at C speed. Only safe when no double quote
+    # precedes the first brace - otherwise the quote toggles string state
+    # and the scan must start from the beginning.
+    first_quote = text.find('"', 0, first_brace)
+    scan_from = first_brace if first_quote == -1 else 0
+
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i, ch in enumerate(text[scan_from:], scan_from):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}' and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
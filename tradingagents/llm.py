@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import importlib.util
+import json
 import os
 from dataclasses import dataclass
 from typing import Any, Dict, List, Mapping, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
+from .jsonutils import json_dumps_sorted
+
 try:
     from dotenv import load_dotenv
 except ImportError:  # pragma: no cover - dependency optional until installed
@@ -16,16 +21,27 @@ try:
 except ImportError:  # pragma: no cover - optional dependency guard
     AsyncOpenAI = None  # type: ignore[assignment]
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - ships with the openai package
+    httpx = None  # type: ignore[assignment]
+
 if load_dotenv is not None:
     load_dotenv(override=False)
 
 try:
     import torch
-    from transformers import AutoModelForCausalLM, AutoTokenizer, TextIteratorStreamer
+    from transformers import (
+        AutoModelForCausalLM,
+        AutoTokenizer,
+        BitsAndBytesConfig,
+        TextIteratorStreamer,
+    )
 except ImportError:
     torch = None  # type: ignore[assignment]
     AutoModelForCausalLM = None  # type: ignore[assignment]
     AutoTokenizer = None  # type: ignore[assignment]
+    BitsAndBytesConfig = None  # type: ignore[assignment]
     TextIteratorStreamer = None  # type: ignore[assignment]
 
 def _infer_default_model() -> str:
@@ -58,6 +74,12 @@ USE_LOCAL_MODEL = os.environ.get("USE_LOCAL_MODEL", "false").lower() == "true"
 USE_OPENROUTER = os.environ.get("USE_OPENROUTER", "false").lower() == "true"
 
 
+def _request_key(messages: List[Mapping[str, str]], params: Dict[str, Any]) -> str:
+    """Hash a completion request so identical concurrent calls can be deduped."""
+    payload = json_dumps_sorted([messages, params])
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 @dataclass
 class ChatMessage:
     role: str
@@ -121,6 +143,11 @@ def resolve_llm_config() -> LLMConfig:
     )
 
 
+def _flash_attention_available() -> bool:
+    """True when the flash-attn package is importable (CUDA builds only)."""
+    return importlib.util.find_spec("flash_attn") is not None
+
+
 class LocalLLMClient:
     """Local HuggingFace model client using transformers."""
 
@@ -147,7 +174,38 @@ class LocalLLMClient:
         # Add quantization for large models if GPU available
         if self.device == "cuda" and hasattr(torch, "float16"):
             load_kwargs["torch_dtype"] = torch.float16
-        
+
+        # Optional weight quantization: decode is memory-bandwidth-bound,
+        # so int8/int4 weights move 2-4x fewer bytes per generated token.
+        # Gated behind LOCAL_QUANT so full FP16 stays the default.
+        quant = os.environ.get("LOCAL_QUANT", "").lower()
+        if self.device == "cuda" and quant in ("int8", "int4"):
+            if BitsAndBytesConfig is None:
+                raise RuntimeError(
+                    "LOCAL_QUANT requires a transformers version with BitsAndBytesConfig."
+                )
+            if quant == "int4":
+                load_kwargs["quantization_config"] = BitsAndBytesConfig(
+                    load_in_4bit=True,
+                    bnb_4bit_compute_dtype=torch.float16,
+                    bnb_4bit_quant_type="nf4",
+                    bnb_4bit_use_double_quant=True,
+                )
+            else:
+                load_kwargs["quantization_config"] = BitsAndBytesConfig(load_in_8bit=True)
+            # Quantized loads take their compute dtype from the config
+            load_kwargs.pop("torch_dtype", None)
+            print(f"Quantizing weights to {quant} (bitsandbytes)")
+
+        # Kernel-fused attention: flash-attn v2 when its package is
+        # installed, otherwise PyTorch's built-in SDPA kernels - same
+        # attention math with far less HBM traffic than eager
+        if self.device == "cuda":
+            if use_flash_attention and _flash_attention_available():
+                load_kwargs["attn_implementation"] = "flash_attention_2"
+            else:
+                load_kwargs["attn_implementation"] = "sdpa"
+
         self.model = AutoModelForCausalLM.from_pretrained(
             model_name,
             **load_kwargs
@@ -155,12 +213,48 @@ class LocalLLMClient:
         
         # Enable eval mode
         self.model.eval()
-        
+
+        if self.device == "cuda":
+            # Let fp32 matmuls (layernorms, logit projections) use TF32 cores
+            torch.set_float32_matmul_precision("high")
+            # Inductor graph capture: fuses the decode step, paid for once
+            # at the warmup generate below instead of on the first request
+            try:
+                self.model = torch.compile(
+                    self.model, mode="reduce-overhead", fullgraph=False
+                )
+            except Exception:
+                pass  # older torch or unsupported backend - run eager
+            warmup = self.tokenizer("ping", return_tensors="pt").to(self.model.device)
+            with torch.no_grad():
+                self.model.generate(
+                    **warmup, max_new_tokens=1, do_sample=False,
+                    pad_token_id=self.tokenizer.eos_token_id,
+                )
+
         # Thread pool for blocking operations
         self.executor = ThreadPoolExecutor(max_workers=2)
-        
+
+        # In-flight request map for single-flight deduplication
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Memoized prompt encodings: backtests replay identical chat-templated
+        # prompts across iterations, and the static system prefix dominates
+        # their length. Bounded so memory stays flat on long sweeps.
+        self._encode_cache: Dict[str, Any] = {}
+
         print("Model loaded successfully!")
 
+    _ENCODE_CACHE_MAX = 128
+
+    def tokenize(self, text: str) -> List[int]:
+        """Token IDs for text, without special tokens.
+
+        Lets callers pre-tokenize static prompt fragments (e.g. an agent's
+        system prompt) once instead of paying tokenizer CPU per request.
+        """
+        return self.tokenizer.encode(text, add_special_tokens=False)
+
     def _format_messages(self, messages: List[Mapping[str, str]]) -> str:
         """Convert OpenAI-style messages to model format."""
         # For Qwen models, use their chat template
@@ -190,9 +284,38 @@ class LocalLLMClient:
         messages: List[Mapping[str, str]],
         temperature: float = 0.2,
         max_tokens: int = 900,
+        cacheable_system: bool = False,
+        tier: str = "fast",
+        json_mode: bool = False,
         **kwargs: Any,
     ) -> str:
-        """Generate completion asynchronously."""
+        """Generate completion asynchronously.
+
+        Identical concurrent requests are single-flighted: they share one
+        generation instead of each occupying a worker thread.
+
+        cacheable_system, tier and json_mode are accepted for interface
+        parity with the API client; local generation has no prefix cache to
+        hint, only one loaded model, and no decoder-side JSON constraint.
+        """
+        key = _request_key(messages, {"temperature": temperature, "max_tokens": max_tokens, **kwargs})
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._complete_impl(messages, temperature, max_tokens, kwargs)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, _k=key: self._inflight.pop(_k, None))
+            return await task
+        return await asyncio.shield(task)
+
+    async def _complete_impl(
+        self,
+        messages: List[Mapping[str, str]],
+        temperature: float,
+        max_tokens: int,
+        kwargs: Dict[str, Any],
+    ) -> str:
         # Run generation in thread pool to avoid blocking
         loop = asyncio.get_event_loop()
         result = await loop.run_in_executor(
@@ -216,9 +339,14 @@ class LocalLLMClient:
         # Format messages
         prompt = self._format_messages(messages)
         
-        # Tokenize
-        inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
-        
+        # Tokenize, reusing the cached encoding when the exact prompt repeats
+        inputs = self._encode_cache.get(prompt)
+        if inputs is None:
+            inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
+            if len(self._encode_cache) >= self._ENCODE_CACHE_MAX:
+                self._encode_cache.pop(next(iter(self._encode_cache)))
+            self._encode_cache[prompt] = inputs
+
         # Generation parameters
         gen_kwargs = {
             "max_new_tokens": max_tokens,
@@ -242,6 +370,36 @@ class LocalLLMClient:
         
         return response.strip()
 
+    async def complete_stream(
+        self,
+        messages: List[Mapping[str, str]],
+        temperature: float = 0.2,
+        max_tokens: int = 900,
+        cacheable_system: bool = False,
+        tier: str = "fast",
+        json_mode: bool = False,
+        **kwargs: Any,
+    ):
+        """Stream completion chunks.
+
+        transformers generation runs to completion in the worker thread, so
+        this yields the full response as a single chunk; it exists so callers
+        can use one streaming code path for both client types.
+        """
+        yield await self.complete(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+
+    async def complete_batch(
+        self,
+        batch_messages: List[List[Mapping[str, str]]],
+        **kwargs: Any,
+    ) -> List[str]:
+        """Complete several message lists concurrently on the thread pool."""
+        return list(await asyncio.gather(
+            *(self.complete(messages, **kwargs) for messages in batch_messages)
+        ))
+
     async def retrying_complete(
         self,
         messages: List[Mapping[str, str]],
@@ -304,24 +462,109 @@ class APILLMClient:
         self.provider = "openrouter" if "openrouter.ai" in resolved_base_url else "openai"
         self.base_url = resolved_base_url
         self.model = resolved_model
+        # One keep-alive connection pool for the client's lifetime: every
+        # agent call reuses warm TCP+TLS connections instead of paying a
+        # handshake per request. Agents share this client instance.
+        self._http_client = None
+        if httpx is not None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=64),
+            )
         self._client = AsyncOpenAI(
             base_url=resolved_base_url,
             **({"api_key": resolved_api_key} if resolved_api_key else {}),
             default_headers=headers or None,
+            **({"http_client": self._http_client} if self._http_client is not None else {}),
         )
         self._default_kwargs = default_kwargs
+        # Model tiers: routine analyst calls use the fast (cheap) model and
+        # contested debate turns escalate to the strong one. Both default to
+        # the resolved model, so tiering is opt-in via environment config.
+        self._tier_models = {
+            "fast": os.environ.get("LLM_FAST_MODEL", resolved_model),
+            "strong": os.environ.get("LLM_STRONG_MODEL", resolved_model),
+        }
+        # In-flight request map for single-flight deduplication
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def aclose(self) -> None:
+        """Close the API client and its connection pool."""
+        await self._client.close()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    def _mark_cacheable_system(
+        self, messages: List[Mapping[str, str]]
+    ) -> List[Mapping[str, str]]:
+        """Attach a prompt-cache marker to the system message when supported.
+
+        Anthropic-compatible endpoints need an explicit cache_control marker;
+        OpenAI and vLLM cache byte-identical prefixes automatically, so for
+        those the messages pass through unchanged (prompts are kept
+        byte-stable by building them from fixed templates).
+        """
+        if "anthropic" not in self.base_url:
+            return messages
+        marked = []
+        for msg in messages:
+            if msg.get("role") == "system":
+                msg = {
+                    "role": "system",
+                    "content": [{
+                        "type": "text",
+                        "text": msg["content"],
+                        "cache_control": {"type": "ephemeral"},
+                    }],
+                }
+            marked.append(msg)
+        return marked
 
     async def complete(
         self,
         messages: List[Mapping[str, str]],
         temperature: float = 0.2,
         max_tokens: int = 900,
+        cacheable_system: bool = False,
+        tier: str = "fast",
+        json_mode: bool = False,
         **kwargs: Any,
+    ) -> str:
+        if cacheable_system:
+            messages = self._mark_cacheable_system(messages)
+        if json_mode and "anthropic" not in self.base_url:
+            # Provider-enforced JSON output: no prose wrapper to strip and
+            # no malformed-JSON retry. Anthropic endpoints lack the flag;
+            # callers' tolerant parsing stays as the fallback there.
+            kwargs = {**kwargs, "response_format": {"type": "json_object"}}
+        model = self._tier_models.get(tier, self.model)
+        # Single-flight: identical concurrent requests (retries, duplicated
+        # agent calls) share one API response instead of paying twice
+        key = _request_key(
+            messages,
+            {"model": model, "temperature": temperature, "max_tokens": max_tokens, **kwargs},
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._complete_impl(messages, temperature, max_tokens, kwargs, model)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, _k=key: self._inflight.pop(_k, None))
+            return await task
+        return await asyncio.shield(task)
+
+    async def _complete_impl(
+        self,
+        messages: List[Mapping[str, str]],
+        temperature: float,
+        max_tokens: int,
+        kwargs: Dict[str, Any],
+        model: Optional[str] = None,
     ) -> str:
         params = dict(self._default_kwargs)
         params.update(kwargs)
         response = await self._client.chat.completions.create(
-            model=self.model,
+            model=model or self.model,
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens,
@@ -331,6 +574,49 @@ class APILLMClient:
             raise RuntimeError("Empty completion from LLM.")
         return response.choices[0].message.content or ""
 
+    async def complete_stream(
+        self,
+        messages: List[Mapping[str, str]],
+        temperature: float = 0.2,
+        max_tokens: int = 900,
+        cacheable_system: bool = False,
+        tier: str = "fast",
+        json_mode: bool = False,
+        **kwargs: Any,
+    ):
+        """Stream completion content chunks as they arrive from the API."""
+        if cacheable_system:
+            messages = self._mark_cacheable_system(messages)
+        if json_mode and "anthropic" not in self.base_url:
+            kwargs = {**kwargs, "response_format": {"type": "json_object"}}
+        params = dict(self._default_kwargs)
+        params.update(kwargs)
+        stream = await self._client.chat.completions.create(
+            model=self._tier_models.get(tier, self.model),
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            **params,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def complete_batch(
+        self,
+        batch_messages: List[List[Mapping[str, str]]],
+        **kwargs: Any,
+    ) -> List[str]:
+        """Complete several message lists in one batch.
+
+        Requests are issued concurrently on the shared AsyncOpenAI client, so
+        connection setup and pool overhead are amortized across the batch.
+        """
+        return list(await asyncio.gather(
+            *(self.complete(messages, **kwargs) for messages in batch_messages)
+        ))
+
     async def retrying_complete(
         self,
         messages: List[Mapping[str, str]],
@@ -8,13 +8,22 @@ Designed to be simple, serializable, and suitable for RL training.
 from __future__ import annotations
 
 import json
+import sys
+import time
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .jsonutils import json_dumps, json_loads
 
-@dataclass
+
+def _isoformat_ns(ns: int) -> str:
+    """Render a time.time_ns() timestamp as an ISO-8601 UTC string."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+@dataclass(slots=True)
 class AnalysisRequest:
     """
     Request for trading analysis.
@@ -36,11 +45,11 @@ class AnalysisRequest:
             self.trade_date = datetime.now().strftime("%Y-%m-%d")
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentProposal:
     """
     Proposal from a single agent.
-    
+
     Attributes:
         agent: Agent name (e.g., 'news', 'technical', 'fundamental')
         action: Recommended action ('BUY', 'SELL', 'HOLD')
@@ -48,6 +57,11 @@ class AgentProposal:
         thesis: Main argument/thesis
         evidence: List of supporting evidence
         neutral: Whether this is a neutral/fallback proposal
+
+    Uses __slots__: thousands of proposals accumulate in batch backtests, so
+    the fixed attribute layout saves a per-instance __dict__. Agent name and
+    action are interned - they come from a tiny value set and get compared
+    constantly in debate/convergence checks.
     """
     agent: str
     action: str
@@ -55,17 +69,56 @@ class AgentProposal:
     thesis: str
     evidence: List[str] = field(default_factory=list)
     neutral: bool = False
-    
+    # Lazily cached view of the top evidence points (see top_evidence)
+    _top_evidence: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Lazily cached rendered evidence lines (see evidence_block)
+    _evidence_block: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        self.action = self.action.upper()
+        self.agent = sys.intern(self.agent)
+        self.action = sys.intern(self.action.upper())
         self.conviction = max(0.0, min(1.0, self.conviction))  # Clamp to [0, 1]
-    
+
+    @property
+    def top_evidence(self) -> tuple:
+        """First three evidence points as a shared tuple.
+
+        Debate formatting reads the top evidence for every peer in every
+        round; caching the slice avoids rebuilding a small list each time.
+        Computed on first access, so populate evidence before reading it.
+        """
+        if self._top_evidence is None:
+            self._top_evidence = tuple(self.evidence[:3])
+        return self._top_evidence
+
+    @property
+    def evidence_block(self) -> str:
+        """Indented "Evidence:" lines (top five points), or "" when empty.
+
+        The controller re-renders every proposal's evidence for each
+        evaluation/decision/debate prompt; rendering once per proposal turns
+        those passes into plain string appends. Same caveat as top_evidence:
+        populate evidence before reading it.
+        """
+        if self._evidence_block is None:
+            if self.evidence:
+                self._evidence_block = "\n  Evidence:" + "".join(
+                    "\n    - " + ev for ev in self.evidence[:5]
+                )
+            else:
+                self._evidence_block = ""
+        return self._evidence_block
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        data = asdict(self)
+        # internal caches, not part of the contract
+        data.pop("_top_evidence", None)
+        data.pop("_evidence_block", None)
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class ControllerPlan:
     """
     Analysis plan created by LLM controller.
@@ -86,7 +139,7 @@ class ControllerPlan:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """
     Evaluation of agent proposals by LLM controller.
@@ -113,7 +166,7 @@ class EvaluationResult:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DebateRecord:
     """
     Record of debate process.
@@ -132,7 +185,7 @@ class DebateRecord:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalDecision:
     """
     Final investment decision.
@@ -151,7 +204,9 @@ class FinalDecision:
         agent_weights: Weight given to each agent
         agent_proposals: All agent proposals
         evaluation: Evaluation result
-        timestamp: Decision timestamp (ISO format)
+        timestamp: Decision timestamp - time.time_ns() int internally
+            (datetime.isoformat is measurably slow on hot decision paths),
+            rendered as an ISO string on serialization
     """
     symbol: str
     horizon: str
@@ -163,7 +218,7 @@ class FinalDecision:
     agent_weights: Dict[str, float] = field(default_factory=dict)
     agent_proposals: Dict[str, AgentProposal] = field(default_factory=dict)
     evaluation: Optional[EvaluationResult] = None
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: int | str = field(default_factory=time.time_ns)
     
     def __post_init__(self):
         self.recommendation = self.recommendation.upper()
@@ -180,7 +235,9 @@ class FinalDecision:
             "key_factors": self.key_factors,
             "risks": self.risks,
             "agent_weights": self.agent_weights,
-            "timestamp": self.timestamp
+            # Loaded decisions carry the already-rendered string through
+            "timestamp": _isoformat_ns(self.timestamp)
+            if isinstance(self.timestamp, int) else self.timestamp
         }
         
         # Add agent proposals
@@ -196,7 +253,7 @@ class FinalDecision:
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return json_dumps(self.to_dict(), pretty=True)
     
     def save(self, output_dir: Path) -> Path:
         """
@@ -220,7 +277,7 @@ class FinalDecision:
         return filepath
 
 
-@dataclass
+@dataclass(slots=True)
 class Trajectory:
     """
     Complete decision-making trajectory for RL training.
@@ -247,7 +304,8 @@ class Trajectory:
         """
         step = {
             "step": step_name,
-            "timestamp": datetime.utcnow().isoformat(),
+            # int nanoseconds; rendered as ISO strings lazily in to_dict
+            "timestamp": time.time_ns(),
             "data": self._serialize(data)
         }
         self.steps.append(step)
@@ -266,16 +324,20 @@ class Trajectory:
             return str(data)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
+        """Convert to dictionary, rendering timestamps as ISO strings."""
         return {
-            "steps": self.steps,
+            "steps": [
+                {**step, "timestamp": _isoformat_ns(step["timestamp"])}
+                if isinstance(step.get("timestamp"), int) else step
+                for step in self.steps
+            ],
             "metadata": self.metadata,
             "total_steps": len(self.steps)
         }
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return json_dumps(self.to_dict(), pretty=True)
     
     def save(self, output_dir: Path, symbol: str = "unknown"):
         """
@@ -293,7 +355,35 @@ class Trajectory:
         
         with open(filepath, 'w') as f:
             f.write(self.to_json())
-        
+
+        return filepath
+
+    def flush(self, filepath: Path) -> Path:
+        """
+        Append buffered steps to a JSON-lines file, then drop them.
+
+        Long backtests otherwise retain every prompt and response string for
+        the whole run; flushing between analyses keeps peak memory flat while
+        preserving the full step stream on disk (one JSON object per line,
+        the same format as the controller's incremental step log). Metadata
+        stays on the trajectory.
+
+        Args:
+            filepath: JSONL file to append to (created if missing)
+
+        Returns:
+            Path to the file written
+        """
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(filepath, 'a') as f:
+            for step in self.steps:
+                if isinstance(step.get("timestamp"), int):
+                    step = {**step, "timestamp": _isoformat_ns(step["timestamp"])}
+                f.write(json_dumps(step) + "\n")
+        self.steps.clear()
+
         return filepath
 
 
@@ -308,7 +398,7 @@ def load_decision(filepath: Path) -> FinalDecision:
         FinalDecision object
     """
     with open(filepath, 'r') as f:
-        data = json.load(f)
+        data = json_loads(f.read())
     
     # Reconstruct agent proposals
     agent_proposals = {}
@@ -346,7 +436,7 @@ def load_trajectory(filepath: Path) -> Trajectory:
         Trajectory object
     """
     with open(filepath, 'r') as f:
-        data = json.load(f)
+        data = json_loads(f.read())
     
     trajectory = Trajectory()
     trajectory.steps = data.get("steps", [])